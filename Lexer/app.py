@@ -1,4 +1,8 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify
+from collections import OrderedDict
+import gzip
+import os
+import threading
 import uuid
 from lexer import Lexer
 from parser import Parser
@@ -7,6 +11,41 @@ from interpreter import Interpreter, InterpreterError
 
 app = Flask(__name__)
 
+# orjson encodes the large token payloads far faster than the stdlib json
+# behind jsonify; fall back to jsonify when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Bodies at least this large are gzipped when the client accepts it; the
+# token JSON repeats the same types and lexemes and compresses very well
+GZIP_MIN_SIZE = 4096
+# Every response is compressed afresh, so the fastest level is used; it
+# already shrinks the token tables about twentyfold
+GZIP_LEVEL = 1
+
+def json_response(payload):
+    if orjson is None:
+        response = jsonify(payload)
+    else:
+        try:
+            body = orjson.dumps(payload)
+        except TypeError:
+            # orjson refuses nesting deeper than 254 levels, which the AST of
+            # a long program reaches; the stdlib encoder goes deeper
+            response = jsonify(payload)
+        else:
+            response = Response(body, mimetype='application/json')
+    response.vary.add('Accept-Encoding')
+    # quality-aware, so 'gzip;q=0' counts as a refusal
+    if request.accept_encodings['gzip']:
+        body = response.get_data()
+        if len(body) >= GZIP_MIN_SIZE:
+            response.set_data(gzip.compress(body, compresslevel=GZIP_LEVEL))
+            response.headers['Content-Encoding'] = 'gzip'
+    return response
+
 # In-memory terminal sessions (per browser tab/user session)
 _SESSIONS = {}
 
@@ -14,62 +53,103 @@ _SESSIONS = {}
 def index():
     return render_template('index.html')
 
-@app.route('/tokenize', methods=['POST'])
-def tokenize():
-    data = request.get_json()
-    source_code = data.get('code', '')
-    
-    lexer = Lexer(source_code)
-    tokens = lexer.tokenize()
-    
-    # Convert tokens to dictionaries for JSON response
-    tokens_dict = [token.to_dict() for token in tokens]
-    
-    # Separate errors for the error section
-    errors = [t for t in tokens_dict if t['is_error']]
-    
-    return jsonify({
-        'all_tokens': tokens_dict,  # Send all tokens including errors
-        'errors': errors
-    })
+# Token lists of recently lexed sources, shared by /tokenize, /parse and
+# /run so a buffer that Run Lexer just sent to /tokenize is not lexed again
+# when Run Program sends it to /run. Least recently used first; the token
+# lists are read-only.
+# Token lists grow with their source, so the cache is bounded by the total
+# length of the sources it holds rather than by entry count.
+_LEX_CACHE = OrderedDict()
+_LEX_CACHE_MAX_CHARS = 256 * 1024
+_LEX_CACHE_CHARS = 0
+_LEX_CACHE_LOCK = threading.Lock()
+
+def cached_tokens(source_code):
+    with _LEX_CACHE_LOCK:
+        tokens = _LEX_CACHE.get(source_code)
+        if tokens is not None:
+            _LEX_CACHE.move_to_end(source_code)
+        return tokens
+
+def lex(source_code):
+    global _LEX_CACHE_CHARS
+    tokens = cached_tokens(source_code)
+    if tokens is None:
+        tokens = Lexer(source_code).tokenize()
+        if len(source_code) > _LEX_CACHE_MAX_CHARS:
+            return tokens
+        with _LEX_CACHE_LOCK:
+            if source_code not in _LEX_CACHE:
+                _LEX_CACHE_CHARS += len(source_code)
+            _LEX_CACHE[source_code] = tokens
+            while _LEX_CACHE_CHARS > _LEX_CACHE_MAX_CHARS:
+                evicted, _ = _LEX_CACHE.popitem(last=False)
+                _LEX_CACHE_CHARS -= len(evicted)
+    return tokens
+
+# Build the token table for JSON responses in a single pass, collecting
+# the error dicts and the error-free tokens for the parser. Every endpoint
+# sends the table column-wise (one list per field, all tokens including
+# errors) so the keys are not repeated for every token.
+def split_tokens(tokens):
+    types = []
+    values = []
+    lines = []
+    columns = []
+    errors_mask = []
+    errors = []
+    valid_tokens = []
+    for token in tokens:
+        types.append(token.type)
+        values.append(token.value)
+        lines.append(token.line)
+        columns.append(token.column)
+        errors_mask.append(token.is_error)
+        if token.is_error:
+            errors.append(token.to_dict())
+        else:
+            valid_tokens.append(token)
+    token_table = {
+        'types': types,
+        'values': values,
+        'lines': lines,
+        'columns': columns,
+        'errors_mask': errors_mask
+    }
+    return token_table, errors, valid_tokens
 
-@app.route('/parse', methods=['POST'])
-def parse():
-    data = request.get_json()
-    source_code = data.get('code', '')
+def tokenize_payload(source_code):
+    token_table, errors, _ = split_tokens(lex(source_code))
+    return {**token_table, 'errors': errors}
 
-    # Tokenizer
-    lexer = Lexer(source_code)
-    tokens = lexer.tokenize()
-    
-    tokens_dict = [token.to_dict() for token in tokens]
-    lexical_errors = [t for t in tokens_dict if t['is_error']]
+def parse_payload(source_code):
+    tokens = lex(source_code)
+    token_table, lexical_errors, valid_tokens = split_tokens(tokens)
 
     # Lexical Errors
     if lexical_errors:
-        return jsonify({
+        return {
             'success': False,
             'error': 'Cannot parse: Lexical Impostors must be ejected first.',
-            'all_tokens': tokens_dict,
+            'all_tokens': token_table,
             'lexical_errors': lexical_errors, 
             'syntax_errors': []
-        })
+        }
 
     # Parsley
-    valid_tokens = [t for t in tokens if not t.is_error]
     parser = Parser(valid_tokens)
     ast, syntax_errors = parser.parse()
 
     syntax_errors_dict = [err.to_dict() for err in syntax_errors]
 
     if syntax_errors:
-        return jsonify({
+        return {
             'success': False,
-            'all_tokens': tokens_dict,  
+            'all_tokens': token_table,  
             'lexical_errors': [],
             'syntax_errors': syntax_errors_dict,
             'semantic_errors': []
-        })
+        }
 
     # Semantic Analysis
     semantic_errors = []
@@ -79,16 +159,30 @@ def parse():
         semantic_errors = [err.to_dict() for err in analyzer.analyze()]
         semantic_warnings = [w.to_dict() for w in analyzer.warnings]
 
-    return jsonify({
+    return {
         'success': True if not semantic_errors else False,
         'message': 'Parsing successful!' if not semantic_errors else 'Semantic errors found.',
-        'all_tokens': tokens_dict, 
+        'all_tokens': token_table, 
         'lexical_errors': [],
         'syntax_errors': [],     
         'semantic_errors': semantic_errors,
         'semantic_warnings': semantic_warnings,
         'ast': ast.to_dict() if ast else None
-    })
+    }
+
+@app.route('/tokenize', methods=['POST'])
+def tokenize():
+    data = request.get_json()
+    source_code = data.get('code', '')
+    
+    return json_response(tokenize_payload(source_code))
+
+@app.route('/parse', methods=['POST'])
+def parse():
+    data = request.get_json()
+    source_code = data.get('code', '')
+
+    return json_response(parse_payload(source_code))
 
 
 @app.route('/run', methods=['POST'])
@@ -96,16 +190,14 @@ def run_code():
     data = request.get_json()
     source_code = data.get('code', '')
 
-    lexer = Lexer(source_code)
-    tokens = lexer.tokenize()
-    tokens_dict = [token.to_dict() for token in tokens]
-    lexical_errors = [t for t in tokens_dict if t['is_error']]
+    tokens = lex(source_code)
+    token_table, lexical_errors, valid_tokens = split_tokens(tokens)
 
     if lexical_errors:
-        return jsonify({
+        return json_response({
             'success': False,
             'stage': 'lexical',
-            'all_tokens': tokens_dict,
+            'all_tokens': token_table,
             'lexical_errors': lexical_errors,
             'syntax_errors': [],
             'semantic_errors': [],
@@ -113,16 +205,15 @@ def run_code():
             'terminal': None,
         })
 
-    valid_tokens = [t for t in tokens if not t.is_error]
     parser = Parser(valid_tokens)
     ast, syntax_errors = parser.parse()
     syntax_errors_dict = [err.to_dict() for err in syntax_errors]
 
     if syntax_errors:
-        return jsonify({
+        return json_response({
             'success': False,
             'stage': 'syntax',
-            'all_tokens': tokens_dict,
+            'all_tokens': token_table,
             'lexical_errors': [],
             'syntax_errors': syntax_errors_dict,
             'semantic_errors': [],
@@ -136,10 +227,10 @@ def run_code():
     semantic_warnings = [w.to_dict() for w in analyzer.warnings]
 
     if semantic_errors:
-        return jsonify({
+        return json_response({
             'success': False,
             'stage': 'semantic',
-            'all_tokens': tokens_dict,
+            'all_tokens': token_table,
             'lexical_errors': [],
             'syntax_errors': [],
             'semantic_errors': semantic_errors,
@@ -168,10 +259,10 @@ def run_code():
         'runtime_errors': runtime_errors,
     }
 
-    return jsonify({
+    return json_response({
         'success': True if not runtime_errors else False,
         'stage': 'runtime',
-        'all_tokens': tokens_dict,
+        'all_tokens': token_table,
         'lexical_errors': [],
         'syntax_errors': [],
         'semantic_errors': [],
@@ -188,7 +279,7 @@ def stdin():
 
     interp = _SESSIONS.get(session_id)
     if not interp:
-        return jsonify({
+        return json_response({
             'success': False,
             'error': 'Terminal session not found. Please run again.',
             'terminal': None,
@@ -210,10 +301,20 @@ def stdin():
         'runtime_errors': runtime_errors,
     }
 
-    return jsonify({
+    return json_response({
         'success': True if not runtime_errors else False,
         'terminal': term,
     })
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5000)
\ No newline at end of file
+    # OXC_DEBUG=1 keeps the reloading Flask dev server; otherwise serve
+    # through waitress' thread pool when it is available
+    if os.environ.get('OXC_DEBUG'):
+        app.run(debug=True, port=5000)
+    else:
+        try:
+            from waitress import serve
+        except ImportError:
+            app.run(threaded=True, port=5000)
+        else:
+            serve(app, threads=8, port=5000)
\ No newline at end of file
@@ -18,195 +18,132 @@ logical = {'&','|'}
 operator = arithmetic | relational | logical | {'=', '!'}
 wspace = {' ', '\n', '\t'}
 
+# LOOKUP TABLES
+# Every delimiter set is precomputed once over Latin-1 into a frozenset, so a
+# predicate is a single hashed membership test. Anything past Latin-1 can only
+# be a letter or digit, so sets that accept those fall back to
+# isalpha()/isalnum() for such characters.
+def _table(*groups, letters=None):
+    accepted = set(wspace).union(*groups)
+    return frozenset(
+        chr(c) for c in range(256)
+        if chr(c) in accepted or (letters is not None and letters(chr(c)))
+    )
+
+WSPACE_DLM = _table()
+FUN_DLM = _table('(')
+TERM_DLM = _table('})', letters=str.isalpha)
+NUM_DLM = _table(operator, ',~)]}:')
+SINGQ_DLM = _table('=,~)}:&')
+DOUBQ_DLM = _table('=,~&)}')
+BOOL_DLM = _table(logical, '~,)}')
+ID_DLM = _table(operator, '(),.~[]{}')
+ASS_DLM = _table('({-', letters=str.isalnum)
+EQUAL_DLM = _table('("{-', letters=str.isalnum)
+NOT_DLM = FUN_DLM  # same set: '(' or whitespace
+EQTO_DLM = _table('-"\'(', letters=str.isalnum)
+REL_DLM = _table('-(\'', letters=str.isalnum)
+LOG_DLM = _table('-(', letters=str.isalnum)
+DO_DLM = _table('{')
+CTRL_DLM = _table('~')
+COLON_DLM = _table(letters=str.isalpha)
+STRM_DLM = _table(':')
+ARITH_DLM = REL_DLM  # same set: alnum, whitespace, '(', "'", '-'
+AMPER_DLM = _table('"\'')
+SUB_DLM = _table('(\'', letters=str.isalnum)
+UNARY_DLM = _table('~)', letters=str.isalpha)
+COMMA_DLM = _table('"\'-{', letters=str.isalnum)
+CLOSECURL_DLM = _table('~},', letters=str.isalpha)
+CLOSEPARE_DLM = _table(operator, '~{})],')
+CLOSESQUA_DLM = _table(operator, ',~)[')
+OPENCURL_DLM = _table('"\'{}-', letters=str.isalnum)
+OPENPARE_DLM = _table('"\'()+-!', letters=str.isalnum)
+OPENSQUA_DLM = _table('(]', letters=str.isalnum)
+
 # DELIMITERS
 def wspace_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace)
-    
+    return char in WSPACE_DLM
+
 def fun_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace or 
-            char == '(')
-    
+    return char in FUN_DLM
+
 def term_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace or
-            char.isalpha() or
-            char in '})')
-    
+    return char in TERM_DLM or (char > '\xff' and char.isalpha())
+
 def num_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace or 
-            char in operator or
-            char in ',~)]}:')
-    
+    return char in NUM_DLM
+
 def singq_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace or
-            char in '=,~)}:&')
-    
+    return char in SINGQ_DLM
+
 def doubq_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace or
-            char in '=,~&)}')
+    return char in DOUBQ_DLM
 
 def bool_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace or
-            char in '~,)}' or
-            char in logical)
+    return char in BOOL_DLM
 
 def id_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace or 
-            char in operator or
-            char in '(),.~[]{}')
+    return char in ID_DLM
 
 def ass_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace or 
-            char.isalnum() or
-            char in '({-')
+    return char in ASS_DLM or (char > '\xff' and char.isalnum())
 
 def equal_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace or 
-            char.isalnum() or
-            char in '("{-')
+    return char in EQUAL_DLM or (char > '\xff' and char.isalnum())
 
 def not_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace or 
-            char == '(')
+    return char in NOT_DLM
 
 def eqto_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace or 
-            char.isalnum() or
-            char in '-"\'(')
+    return char in EQTO_DLM or (char > '\xff' and char.isalnum())
 
 def rel_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace or 
-            char.isalnum() or
-            char in '-(\'')
+    return char in REL_DLM or (char > '\xff' and char.isalnum())
 
 def log_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace or 
-            char.isalnum() or
-            char in '-(')
+    return char in LOG_DLM or (char > '\xff' and char.isalnum())
 
 def do_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace or 
-            char == '{')
+    return char in DO_DLM
 
 def ctrl_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace or 
-            char == '~')
+    return char in CTRL_DLM
 
 def colon_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace or 
-            char.isalpha())
+    return char in COLON_DLM or (char > '\xff' and char.isalpha())
 
 def strm_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace or 
-            char == ':')
+    return char in STRM_DLM
 
 def arith_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace or 
-            char.isalnum() or
-            char in '(\'-')
+    return char in ARITH_DLM or (char > '\xff' and char.isalnum())
 
 def amper_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace or 
-            char in '"\'')
+    return char in AMPER_DLM
 
 def sub_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace or 
-            char.isalnum() or
-            char in '(\'')
+    return char in SUB_DLM or (char > '\xff' and char.isalnum())
 
 def unary_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace or 
-            char.isalpha() or
-            char in '~)')
+    return char in UNARY_DLM or (char > '\xff' and char.isalpha())
 
 def comma_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace or 
-            char.isalnum() or
-            char in '"\'-{')
+    return char in COMMA_DLM or (char > '\xff' and char.isalnum())
 
 def closecurl_dlm(char):
-    if not char:
-        return True
-    return (char in wspace or 
-            char.isalpha() or
-            char in '~},')
+    return not char or char in CLOSECURL_DLM or (char > '\xff' and char.isalpha())
 
 def closepare_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace or 
-            char in operator or
-            char in '~{})],')
+    return char in CLOSEPARE_DLM
 
 def closesqua_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace or 
-            char in operator or
-            char in ',~)[')
+    return char in CLOSESQUA_DLM
 
 def opencurl_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace or 
-            char.isalnum() or
-            char in '"\'{}-')
+    return char in OPENCURL_DLM or (char > '\xff' and char.isalnum())
 
 def openpare_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace or 
-            char.isalnum() or
-            char in '"\'()+-!')
+    return char in OPENPARE_DLM or (char > '\xff' and char.isalnum())
 
 def opensqua_dlm(char):
-    if char == '':
-        return False
-    return (char in wspace or 
-            char.isalnum() or
-            char in '(]')
+    return char in OPENSQUA_DLM or (char > '\xff' and char.isalnum())
@@ -180,7 +180,7 @@ class Interpreter:
                 self.functions[actual_name] = child
                 self.function_return_type[actual_name] = self._read_return_type(child.children[0])
                 self.function_params[actual_name] = self._read_params(child.children[2])
-            elif getattr(child, "type", None) in ("sub_functions",):
+            elif getattr(child, "type", None) in {"sub_functions"}:
                 self._collect_air_funcs(child)
 
     def _read_return_type(self, return_type_node) -> str:
@@ -301,7 +301,7 @@ class Interpreter:
 
     def _exec_id_stat_body(self, vid: str, body_node) -> Any:
         # either function call statement: body=[param_opts]
-        if body_node.children and getattr(body_node.children[0], "type", None) in ("param_opts", "param_opts_empty"):
+        if body_node.children and getattr(body_node.children[0], "type", None) in {"param_opts", "param_opts_empty"}:
             # user-defined function call as statement
             self._call_user_function(vid, body_node.children[0])
             return None
@@ -711,7 +711,7 @@ class Interpreter:
         if (
             tail.type == "id_tail"
             and tail.children
-            and getattr(tail.children[0], "type", None) in ("param_opts", "param_opts_empty")
+            and getattr(tail.children[0], "type", None) in {"param_opts", "param_opts_empty"}
         ):
             return self._call_user_function(id_no, tail.children[0])
         # plain variable reference
@@ -745,7 +745,10 @@ class Interpreter:
             return False
         if isinstance(raw, str):
             if raw.startswith('"') and raw.endswith('"'):
-                inner = raw[1:-1].encode("utf-8").decode("unicode_escape")
+                inner = raw[1:-1]
+                # plain ASCII without a backslash decodes to itself
+                if "\\" in inner or not inner.isascii():
+                    inner = inner.encode("utf-8").decode("unicode_escape")
                 return self._interpolate_string(inner)
             if raw.startswith("'") and raw.endswith("'"):
                 inner = raw[1:-1]
@@ -791,7 +794,7 @@ class Interpreter:
             return 0.0
         if data_type == "bool":
             return False
-        if data_type in ("char", "string"):
+        if data_type in {"char", "string"}:
             return None
         return None
 
@@ -870,9 +873,9 @@ class Interpreter:
             except Exception:
                 raise InterpreterError(f"Invalid float input: '{txt}'")
         if expected_type == "bool":
-            if txt.lower() in ("yuh", "true", "1"):
+            if txt.lower() in {"yuh", "true", "1"}:
                 return True
-            if txt.lower() in ("naur", "false", "0", ""):
+            if txt.lower() in {"naur", "false", "0", ""}:
                 return False
             return True
         return txt
@@ -1,3 +1,6 @@
+import re
+import sys
+from bisect import bisect_right
 from delimiters import (
     wspace_dlm,
     fun_dlm,
@@ -11,7 +14,6 @@ from delimiters import (
     equal_dlm,
     not_dlm,
     eqto_dlm,
-    
     rel_dlm,
     log_dlm,
     do_dlm,
@@ -31,7 +33,125 @@ from delimiters import (
     opensqua_dlm
 )
 
+# RESERVED WORDS
+# keyword -> delimiter that must follow it
+KEYWORDS = {
+    'air': wspace_dlm,
+    'atmosphere': fun_dlm,
+    'bool': wspace_dlm,
+    'case': wspace_dlm,
+    'char': wspace_dlm,
+    'cycle': fun_dlm,
+    'diffuse': strm_dlm,
+    'do': do_dlm,
+    'echo': fun_dlm,
+    'else': do_dlm,
+    'elseif': fun_dlm,
+    'exhale': fun_dlm,
+    'float': wspace_dlm,
+    'flow': ctrl_dlm,
+    'gasp': wspace_dlm,
+    'gust': wspace_dlm,
+    'horizon': fun_dlm,
+    'if': fun_dlm,
+    'inhale': fun_dlm,
+    'int': wspace_dlm,
+    'naur': bool_dlm,
+    'resist': ctrl_dlm,
+    'sizeOf': fun_dlm,
+    'stream': fun_dlm,
+    'string': wspace_dlm,
+    'toBool': fun_dlm,
+    'toChar': fun_dlm,
+    'toFall': fun_dlm,
+    'toFloat': fun_dlm,
+    'toInt': fun_dlm,
+    'toRise': fun_dlm,
+    'toString': fun_dlm,
+    'universal': wspace_dlm,
+    'vacuum': wspace_dlm,
+    'wind': wspace_dlm,
+    'waft': fun_dlm,
+    'yuh': bool_dlm,
+}
+
+# first letters of the reserved words, for the first-character dispatch
+KEYWORD_INITIALS = frozenset(keyword[0] for keyword in KEYWORDS)
+# lengths of the reserved words, checked before any keyword lookup
+KEYWORD_LENGTHS = frozenset(len(keyword) for keyword in KEYWORDS)
+
+# OPERATORS/STRUCTURES
+# characters that can start an operator or structure token
+OPERATOR_STRUCTURE = frozenset('+-*/%(){}[]><=!\\:.~,@&|')
+# single-character structure tokens -> delimiter that must follow them
+STRUCTURE_DELIMITERS = {
+    '(': openpare_dlm,
+    ')': closepare_dlm,
+    '{': opencurl_dlm,
+    '}': closecurl_dlm,
+    '[': opensqua_dlm,
+    ']': closesqua_dlm,
+    ':': colon_dlm,
+    '.': str.isalpha,
+    '~': term_dlm,
+    ',': comma_dlm,
+}
+# operator lexemes -> delimiter that must follow them; the two-character
+# form is only tried when the one-character operator is not delimited
+OPERATOR_DELIMITERS = {
+    '+': arith_dlm,
+    '++': unary_dlm,
+    '+=': ass_dlm,
+    '-': sub_dlm,
+    '--': unary_dlm,
+    '-=': ass_dlm,
+    '*': arith_dlm,
+    '*=': ass_dlm,
+    '/': arith_dlm,
+    '/=': ass_dlm,
+    '%': arith_dlm,
+    '%=': ass_dlm,
+    '>': rel_dlm,
+    '>=': rel_dlm,
+    '<': rel_dlm,
+    '<=': rel_dlm,
+    '=': equal_dlm,
+    '==': eqto_dlm,
+    '!': not_dlm,
+    '!=': eqto_dlm,
+    '&': amper_dlm,
+    '&&': log_dlm,
+    '||': log_dlm,
+}
+# operators positioned at their start rather than just past the lexeme
+START_POSITIONED = frozenset('+-*/')
+# closers after which '-' is subtraction rather than a sign
+CLOSING = frozenset(')]}')
+# one shared string per keyword and operator, so tokens reuse it instead of
+# each holding its own slice of the source
+LEXEMES = {lexeme: sys.intern(lexeme) for lexeme in (*KEYWORDS, *OPERATOR_DELIMITERS)}
+# first character -> second character -> two-character operator, so the
+# compound form is found without building the two-character string
+COMPOUND_OPERATORS = {}
+for lexeme in OPERATOR_DELIMITERS:
+    if len(lexeme) == 2:
+        COMPOUND_OPERATORS.setdefault(lexeme[0], {})[lexeme[1]] = LEXEMES[lexeme]
+
+# whitespace run followed by the next token: a whole word when it starts
+# with an ASCII letter, otherwise just its first character
+NEXT_TOKEN = re.compile(r'\s*(?:([A-Za-z]\w*)|(\S))')
+# \w is exactly isalnum() or '_', the identifier body
+WORD = re.compile(r'\w*')
+# ASCII runs of a number; the digit loops in td_number finish any
+# non-ASCII digits, since \d is not the same set as str.isdigit()
+DIGITS = re.compile(r'[0-9]*')
+FRACTION = re.compile(r'[0-9.]*')
+# char/string literal body: everything up to a quote or newline
+LITERAL_CONTENT = re.compile(r'[^\'"\n]*')
+
 class Token:
+    __slots__ = ('type', 'value', 'line', 'column', 'is_error')
+
     def __init__(self, type, value, line, column):
         self.type = type
         self.value = value
@@ -51,21 +171,40 @@ class Token:
 class Lexer:
     def __init__(self, source_code):
         self.source_code = source_code
+        # fixed for the lexer's lifetime, so measured once
+        self.length = len(source_code)
         self.position = 0
-        self.line = 1
-        self.column = 1
+        # line/column are derived from position through the offsets at
+        # which each line starts
+        self.line_starts = [0] + [match.end() for match in re.finditer('\n', source_code)]
         self.tokens = []
+        # bound once; every diagram emits through it
+        self.emit = self.tokens.append
         self.id_counter = 0
         self.id_map = {}
 
         self.MAX_INT = 9_999_999_999
         self.MIN_INT = -9_999_999_999
+        self.MAX_INT_DIGITS = len(str(self.MAX_INT))
         self.MAX_FLOAT = 10
         self.MAX_FLOAT_POINT = 6
 
+    # (line, column) of a source offset
+    def location(self, position):
+        line = bisect_right(self.line_starts, position)
+        return line, position - self.line_starts[line - 1] + 1
+
+    @property
+    def line(self):
+        return self.location(self.position)[0]
+
+    @property
+    def column(self):
+        return self.location(self.position)[1]
+
     def peek(self, offset=0):
         pos = self.position + offset
-        if pos < len(self.source_code):
+        if pos < self.length:
             return self.source_code[pos]
         return ''
 
@@ -80,51 +219,56 @@ class Lexer:
                 pos -= 1
             return ''
 
-        if pos >= 0 and pos < len(self.source_code):
+        if pos >= 0 and pos < self.length:
             return self.source_code[pos]
         return ''
     
     def advance(self):
-        if self.position < len(self.source_code):
+        if self.position < self.length:
             char = self.source_code[self.position]
             self.position += 1
-            if char == '\n':
-                self.line += 1
-                self.column = 1
-            else:
-                self.column += 1
             return char
         return ''
     
-    # def skip_whitespace(self):
-    #     while self.position < len(self.source_code) and self.peek().isspace():
-    #         self.advance()
     
     def error(self, message, line, column):
-        self.tokens.append(Token('ERROR', message, line, column))
+        self.emit(Token('ERROR', message, line, column))
 
-    def continues_as_identifier(self):
-        next_char = self.peek()
-        return next_char and (next_char.isalnum() or next_char == '_')
+    # a literal or identifier not followed by a valid delimiter: at the end
+    # of a line or of the input nothing is there to blame, otherwise the
+    # offending character is named
+    def delimiter_error(self, char, lexeme, line, column):
+        if char in ['', '\n']:
+            self.error(f"expecting a valid delimiter: {lexeme}", self.line, self.column)
+        else:
+            self.error(f"invalid character after {lexeme}: {char}", line, column)
+        return True
 
-    def check_keyword_delimiter(self, keyword_name, delimiter_func, saved_position, saved_line, saved_column, start_line, start_col):
-        if self.continues_as_identifier(): 
-            self.position = saved_position
-            self.line = saved_line
-            self.column = saved_column
-            return False 
-        elif delimiter_func(self.peek()):
-            self.tokens.append(Token(keyword_name, keyword_name, start_line, start_col))
+    # the keyword was matched as a whole word, so the character after it can
+    # never continue it and nothing has to be rolled back; char is that
+    # character, already read by td_keyword
+    def check_keyword_delimiter(self, keyword_name, delimiter_func, char, start_line, start_col):
+        if delimiter_func(char):
+            self.emit(Token(keyword_name, keyword_name, start_line, start_col))
             return True
         else:
-            char = self.peek()
             if char in ['']:
                 self.error(f"expecting a valid delimiter: {keyword_name}", self.line, self.column)
                 return True
             else:
-                self.error(f"invalid character after '{keyword_name}' keyword: {self.peek()}", self.line, self.column)
+                self.error(f"invalid character after '{keyword_name}' keyword: {char}", self.line, self.column)
                 return True
         
+    # Consumes a char/string literal body up to the next quote, newline or
+    # end of input. Non-ASCII characters are consumed but left out.
+    def scan_literal_content(self):
+        end = LITERAL_CONTENT.match(self.source_code, self.position).end()
+        content = self.source_code[self.position:end]
+        self.position = end
+        if not content.isascii():
+            content = ''.join(char for char in content if ord(char) < 128)
+        return content
+
     def tokenize_single(self):
         if self.td_keyword():
             return True
@@ -137,1010 +281,152 @@ class Lexer:
         return False
 
     # TRANSITION DIAGRAM: Keywords/Reserved Words
-    def td_keyword(self):
-        start_line = self.line
-        start_col = self.column
-        saved_position = self.position  
-        saved_line = self.line          
-        saved_column = self.column
-        
-        char = self.peek()
-        
-        if not char.isalpha():
-            return False
-        # Check for 'a' keywords: air, atmosphere
-        if char == 'a':
-            self.advance()
-            if self.peek() == 'i': 
-                self.advance()
-                if self.peek() == 'r':
-                    self.advance()
-                    return self.check_keyword_delimiter(
-                        'air', wspace_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                    )
-            elif self.peek() == 't': 
-                self.advance()
-                if self.peek() == 'm':
-                    self.advance()
-                    if self.peek() == 'o':
-                        self.advance()
-                        if self.peek() == 's':
-                            self.advance()  
-                            if self.peek() == 'p':
-                                self.advance()
-                                if self.peek() == 'h':
-                                    self.advance()
-                                    if self.peek() == 'e':
-                                        self.advance()
-                                        if self.peek() == 'r':
-                                            self.advance()
-                                            if self.peek() == 'e':
-                                                self.advance()
-                                                return self.check_keyword_delimiter(
-                                                    'atmosphere', fun_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                                                )
-        
-        # Check for 'b' keywords: bool
-        elif char == 'b':
-            self.advance()
-            if self.peek() == 'o':
-                self.advance()
-                if self.peek() == 'o':
-                    self.advance()
-                    if self.peek() == 'l':
-                        self.advance()
-                        return self.check_keyword_delimiter(
-                            'bool', wspace_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                        )
-        
-        # Check for 'c' keywords: case, char, cycle
-        elif char == 'c':
-            self.advance()
-            if self.peek() == 'a': 
-                self.advance()
-                if self.peek() == 's':
-                    self.advance()
-                    if self.peek() == 'e':
-                        self.advance()
-                        return self.check_keyword_delimiter(
-                            'case', wspace_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                        )
-            elif self.peek() == 'h':
-                self.advance()
-                if self.peek() == 'a':
-                    self.advance()
-                    if self.peek() == 'r':
-                        self.advance()
-                        return self.check_keyword_delimiter(
-                            'char', wspace_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                        )
-            elif self.peek() == 'y':
-                self.advance()
-                if self.peek() == 'c':
-                    self.advance()
-                    if self.peek() == 'l':
-                        self.advance()
-                        if self.peek() == 'e':
-                            self.advance()
-                            return self.check_keyword_delimiter(
-                                'cycle', fun_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                            )
-        
-        # Check for 'd' keywords: diffuse, do
-        elif char == 'd':
-            self.advance()
-            if self.peek() == 'i':
-                self.advance()
-                if self.peek() == 'f':
-                    self.advance()
-                    if self.peek() == 'f':
-                        self.advance()
-                        if self.peek() == 'u':
-                            self.advance()
-                            if self.peek() == 's':
-                                self.advance()
-                                if self.peek() == 'e':
-                                    self.advance()
-                                    return self.check_keyword_delimiter(
-                                        'diffuse', strm_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                                    )
-            elif self.peek() == 'o': 
-                self.advance()
-                return self.check_keyword_delimiter(
-                    'do', do_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                )
-        
-        # Check for 'e' keywords: else, elseif, echo, exhale
-        elif char == 'e':
-            self.advance()
-            if self.peek() == 'c': 
-                self.advance()
-                if self.peek() == 'h':
-                    self.advance()
-                    if self.peek() == 'o':
-                        self.advance()
-                        return self.check_keyword_delimiter(
-                            'echo', fun_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                        )
-            elif self.peek() == 'l':
-                self.advance()
-                if self.peek() == 's':
-                    self.advance()
-                    if self.peek() == 'e':
-                        self.advance()
-                        if do_dlm(self.peek()):
-                            self.tokens.append(Token('else', 'else', start_line, start_col))
-                            return True
-                        elif self.peek() == 'i':
-                            self.advance()
-                            if self.peek() == 'f':
-                                self.advance()
-                                return self.check_keyword_delimiter(
-                                    'elseif', fun_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                                )
-                        else:
-                            self.error(f"invalid character after 'else' keyword: {self.peek()}", self.line, self.column)
-                            return True
-            elif self.peek() == 'x':
-                self.advance()
-                if self.peek() == 'h':
-                    self.advance()
-                    if self.peek() == 'a':
-                        self.advance()
-                        if self.peek() == 'l':
-                            self.advance()
-                            if self.peek() == 'e':
-                                self.advance()
-                                return self.check_keyword_delimiter(
-                                    'exhale', fun_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                                )
-        
-        # Check for 'f' keywords: float, flow
-        elif char == 'f':
-            self.advance()
-            if self.peek() == 'l':
-                self.advance()
-                if self.peek() == 'o':
-                    self.advance()
-                    if self.peek() == 'a': 
-                        self.advance()
-                        if self.peek() == 't':
-                            self.advance()
-                            return self.check_keyword_delimiter(
-                                'float', wspace_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                            )
-                    elif self.peek() == 'w': 
-                        self.advance()
-                        return self.check_keyword_delimiter(
-                            'flow', ctrl_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                        )
-        
-        # Check for 'g' keywords: gasp, gust
-        elif char == 'g':
-            self.advance()
-            if self.peek() == 'a':  
-                self.advance()
-                if self.peek() == 's':
-                    self.advance()
-                    if self.peek() == 'p':
-                        self.advance()
-                        return self.check_keyword_delimiter(
-                            'gasp', wspace_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                        )
-            elif self.peek() == 'u':
-                self.advance()
-                if self.peek() == 's':
-                    self.advance()
-                    if self.peek() == 't':
-                        self.advance()
-                        return self.check_keyword_delimiter(
-                            'gust', wspace_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                        )
-                        
-        # Check for 'h' keywords: horizon
-        elif char == 'h':
-            self.advance()
-            if self.peek() == 'o':
-                self.advance()
-                if self.peek() == 'r':
-                    self.advance()
-                    if self.peek() == 'i':
-                        self.advance()
-                        if self.peek() == 'z':
-                            self.advance()
-                            if self.peek() == 'o':
-                                self.advance()
-                                if self.peek() == 'n':
-                                    self.advance()
-                                    return self.check_keyword_delimiter(
-                                        'horizon', fun_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                                    )
-        
-        # Check for 'i' keywords: if, inhale, int
-        elif char == 'i':
-            self.advance()
-            if self.peek() == 'f':
-                self.advance()
-                return self.check_keyword_delimiter(
-                    'if', fun_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                )
-            elif self.peek() == 'n':
-                self.advance()
-                if self.peek() == 'h': 
-                    self.advance()
-                    if self.peek() == 'a':
-                        self.advance()
-                        if self.peek() == 'l':
-                            self.advance()
-                            if self.peek() == 'e':
-                                self.advance()
-                                return self.check_keyword_delimiter(
-                                    'inhale', fun_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                                )
-                elif self.peek() == 't':  
-                    self.advance()
-                    return self.check_keyword_delimiter(
-                        'int', wspace_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                    )
-        
-        # Check for 'n' keywords: naur
-        elif char == 'n':
-            self.advance()
-            if self.peek() == 'a':
-                self.advance()
-                if self.peek() == 'u':
-                    self.advance()
-                    if self.peek() == 'r':
-                        self.advance()
-                        return self.check_keyword_delimiter(
-                            'naur', bool_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                        )
-            
-        # Check for 'r' keywords: resist
-        elif char == 'r':
-            self.advance()
-            if self.peek() == 'e':
-                self.advance()
-                if self.peek() == 's':
-                    self.advance()
-                    if self.peek() == 'i':
-                        self.advance()
-                        if self.peek() == 's':
-                            self.advance()
-                            if self.peek() == 't':
-                                self.advance()
-                                return self.check_keyword_delimiter(
-                                    'resist', ctrl_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                                )
-        
-        # Check for 's' keywords: sizeOf, stream, string
-        elif char == 's':
-            self.advance()
-            if self.peek() == 'i':
-                self.advance()
-                if self.peek() == 'z':
-                    self.advance()
-                    if self.peek() == 'e':
-                        self.advance()
-                        if self.peek() == 'O':
-                            self.advance()
-                            if self.peek() == 'f':
-                                self.advance()
-                                return self.check_keyword_delimiter(
-                                    'sizeOf', fun_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                                )
-                                
-            elif self.peek() == 't':
-                self.advance()
-                if self.peek() == 'r':
-                    self.advance()
-                    if self.peek() == 'e': 
-                        self.advance()
-                        if self.peek() == 'a':
-                            self.advance()
-                            if self.peek() == 'm':
-                                self.advance()
-                                return self.check_keyword_delimiter(
-                                    'stream', fun_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                                )
-                    elif self.peek() == 'i': 
-                        self.advance()
-                        if self.peek() == 'n':
-                            self.advance()
-                            if self.peek() == 'g':
-                                self.advance()
-                                return self.check_keyword_delimiter(
-                                    'string', wspace_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                                )
-                        
-        # Check for 't' keywords: toBool, toChar, toFall, toFloat, toInt, toRise, toString, waft
-        elif char == 't':
-            self.advance()
-            if self.peek() == 'o':
-                self.advance()
-                if self.peek() == 'B': 
-                    self.advance()
-                    if self.peek() == 'o':
-                        self.advance()
-                        if self.peek() == 'o':
-                            self.advance()
-                            if self.peek() == 'l':
-                                self.advance()
-                                return self.check_keyword_delimiter(
-                                    'toBool', fun_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                                )
-                elif self.peek() == 'C': 
-                    self.advance()
-                    if self.peek() == 'h':
-                        self.advance()
-                        if self.peek() == 'a':
-                            self.advance()
-                            if self.peek() == 'r':
-                                self.advance()
-                                return self.check_keyword_delimiter(
-                                    'toChar', fun_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                                )
-                elif self.peek() == 'F':
-                    self.advance()
-                    if self.peek() == 'a':
-                        self.advance()
-                        if self.peek() == 'l':
-                            self.advance()
-                            if self.peek() == 'l':
-                                self.advance()
-                                return self.check_keyword_delimiter(
-                                    'toFall', fun_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                                )
-                    elif self.peek() == 'l':
-                        self.advance()
-                        if self.peek() == 'o':
-                            self.advance()
-                            if self.peek() == 'a':
-                                self.advance()
-                                if self.peek() == 't':
-                                    self.advance()
-                                    return self.check_keyword_delimiter(
-                                        'toFloat', fun_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                                    )
-                elif self.peek() == 'I': 
-                    self.advance()
-                    if self.peek() == 'n':
-                        self.advance()
-                        if self.peek() == 't':
-                            self.advance()
-                            return self.check_keyword_delimiter(
-                                'toInt', fun_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                            )
-                elif self.peek() == 'R': 
-                    self.advance()
-                    if self.peek() == 'i':
-                        self.advance()
-                        if self.peek() == 's':
-                            self.advance()
-                            if self.peek() == 'e':
-                                self.advance()
-                                return self.check_keyword_delimiter(
-                                    'toRise', fun_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                                )
-                elif self.peek() == 'S':  
-                    self.advance()
-                    if self.peek() == 't':
-                        self.advance()
-                        if self.peek() == 'r':
-                            self.advance()
-                            if self.peek() == 'i':
-                                self.advance()
-                                if self.peek() == 'n':
-                                    self.advance()
-                                    if self.peek() == 'g':
-                                        self.advance()
-                                        return self.check_keyword_delimiter(
-                                            'toString', fun_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                                        )
-        
-        # Check for 'u' keywords: universal
-        elif char == 'u':
-            self.advance()
-            if self.peek() == 'n':
-                self.advance()
-                if self.peek() == 'i':
-                    self.advance()
-                    if self.peek() == 'v':
-                        self.advance()
-                        if self.peek() == 'e':
-                            self.advance()
-                            if self.peek() == 'r':
-                                self.advance()
-                                if self.peek() == 's':
-                                    self.advance()
-                                    if self.peek() == 'a':
-                                        self.advance()
-                                        if self.peek() == 'l':
-                                            self.advance()
-                                            return self.check_keyword_delimiter(
-                                                'universal', wspace_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                                            )
-        
-        # Check for 'v' keywords: vacuum
-        elif char == 'v':
-            self.advance()
-            if self.peek() == 'a':
-                self.advance()
-                if self.peek() == 'c':
-                    self.advance()
-                    if self.peek() == 'u':
-                        self.advance()
-                        if self.peek() == 'u':
-                            self.advance()
-                            if self.peek() == 'm':
-                                self.advance()
-                                return self.check_keyword_delimiter(
-                                    'vacuum', wspace_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                                )
-        
-        # Check for 'w' keywords: wind
-        elif char == 'w':
-            self.advance()
-            if self.peek() == 'i':
-                self.advance()
-                if self.peek() == 'n':
-                    self.advance()
-                    if self.peek() == 'd':
-                        self.advance()
-                        return self.check_keyword_delimiter(
-                            'wind', wspace_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                        )
-            elif self.peek() == 'a':
-                self.advance()
-                if self.peek() == 'f':
-                    self.advance()
-                    if self.peek() == 't':
-                        self.advance()
-                        return self.check_keyword_delimiter(
-                            'waft', fun_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                        )
-        
-        # Check for 'y' keywords: yuh
-        elif char == 'y':
-            self.advance()
-            if self.peek() == 'u':
-                self.advance()
-                if self.peek() == 'h':
-                    self.advance()
-                    return self.check_keyword_delimiter(
-                        'yuh', bool_dlm, saved_position, saved_line, saved_column, start_line, start_col
-                    )
-                
-        self.position = saved_position
-        self.line = saved_line
-        self.column = saved_column
-        return False
+    # end is the word's end when tokenize() has already matched it
+    def td_keyword(self, end=None):
+        pos = self.position
+
+        # a keyword is a whole word, so one match and one dict lookup
+        # replace walking the reserved words character by character
+        src = self.source_code
+        if end is None:
+            end = WORD.match(src, pos).end()
+        # words of a length no keyword has are identifiers without slicing
+        # or hashing them, unless they are glued onto an 'else'
+        if end - pos not in KEYWORD_LENGTHS and not src.startswith('else', pos):
+            return self.td_identifier(end)
+        keyword_name = src[pos:end]
+        delimiter_func = KEYWORDS.get(keyword_name)
+        if delimiter_func is None:
+            # only 'elseif' may continue an 'else'; anything else glued to
+            # it is reported on 'else' rather than read as an identifier
+            if keyword_name.startswith('else') and keyword_name[4] != 'i':
+                self.position += 4
+                self.error(f"invalid character after 'else' keyword: {self.peek()}", self.line, self.column)
+                return True
+            # the word is already scanned; finish it as an identifier
+            return self.td_identifier(end)
+        keyword_name = LEXEMES[keyword_name]
+        start_line, start_col = self.location(pos)
+        self.position = end
+        next_char = src[end] if end < self.length else ''
+
+        # 'else' never falls back to an identifier; anything other than a
+        # valid delimiter after it is an error
+        if keyword_name == 'else':
+            if delimiter_func(next_char):
+                self.emit(Token('else', 'else', start_line, start_col))
+            else:
+                self.error(f"invalid character after 'else' keyword: {next_char}", self.line, self.column)
+            return True
+        return self.check_keyword_delimiter(
+            keyword_name, delimiter_func, next_char, start_line, start_col
+        )
          
     # TD - Operator/Structure     
     def td_operator_structure(self):
-        start_line = self.line
-        start_col = self.column
-
-        char = self.peek()
+        src = self.source_code
+        pos = self.position
+        char = src[pos] if pos < self.length else ''
         
-        if char not in '+-*/%(){}[]><=!\\:.~,@&|':
+        if char not in OPERATOR_STRUCTURE:
             return False
-        
-        if char == '+':
-            self.advance()
-            if arith_dlm(self.peek()):
-                self.tokens.append(Token('+','+', start_line, start_col))
-                return True
-            elif self.peek() == '+':
-                self.advance()
-                if unary_dlm(self.peek()):
-                    self.tokens.append(Token('++','++', start_line, start_col))
-                    return True
-                else:
-                    peekChar = self.peek()
-                    if peekChar in ['']:
-                        self.error("expecting a valid delimiter after '++'", self.line, self.column)
-                        return True
-                    else:
-                        self.error(f"invalid character after '++': {self.peek()}", self.line, self.column)
-                        return True
-            elif self.peek() == '=':
-                self.advance()
-                if ass_dlm(self.peek()):
-                    self.tokens.append(Token('+=','+=', start_line, start_col))
-                    return True
-                else:
-                    peekChar = self.peek()
-                    if peekChar in ['']:
-                        self.error("expecting a valid delimiter after '+='", self.line, self.column)
-                        return True
-                    else:
-                        self.error(f"invalid character after '+=': {self.peek()}", self.line, self.column)
-                        return True
-            else:
-                peekChar = self.peek()
-                if peekChar in ['']:
-                    self.error("expecting a valid delimiter after '+'", self.line, self.column)
-                    return True
-                else:
-                    self.error(f"invalid character after '+': {self.peek()}", self.line, self.column)
-                    return True
-            
-        elif char == '-':
-            self.advance()
-            if sub_dlm(self.peek()):
-                self.tokens.append(Token('-','-', start_line, start_col))
-                return True
-            elif self.peek() == '-':
-                self.advance()
-                if unary_dlm(self.peek()):
-                    self.tokens.append(Token('--','--', start_line, start_col))
-                    return True
-                else:
-                    peekChar = self.peek()
-                    if peekChar in ['']:
-                        self.error("expecting a valid delimiter after '--'", self.line, self.column)
-                        return True
-                    else:
-                        self.error(f"invalid character after '--': {self.peek()}", self.line, self.column)
-                        return True
-            elif self.peek() == '=':
-                self.advance()
-                if ass_dlm(self.peek()):
-                    self.tokens.append(Token('-=','-=', start_line, start_col))
-                    return True
-                else:
-                    peekChar = self.peek()
-                    if peekChar in ['']:
-                        self.error("expecting a valid delimiter after '-='", self.line, self.column)
-                        return True
-                    else:
-                        self.error(f"invalid character after '-=': {self.peek()}", self.line, self.column)
-                        return True
-            else:
-                peekChar = self.peek()
-                if peekChar in ['']:
-                    self.error("expecting a valid delimiter after '-'", self.line, self.column)
-                    return True
-                else:
-                    self.error(f"invalid character after '-': {self.peek()}", self.line, self.column)
-                    return True
-            
-        elif char == '*':
-            self.advance()
-            if arith_dlm(self.peek()):
-                self.tokens.append(Token('*','*', start_line, start_col))
-                return True
-            elif self.peek() == '=':
-                self.advance()
-                if ass_dlm(self.peek()):
-                    self.tokens.append(Token('*=','*=', start_line, start_col))
-                    return True
-                else:
-                    peekChar = self.peek()
-                    if peekChar in ['']:
-                        self.error("expecting a valid delimiter after '*='", self.line, self.column)
-                        return True
-                    else:
-                        self.error(f"invalid character after '*=': {self.peek()}", self.line, self.column)
-                        return True
-            else:
-                peekChar = self.peek()
-                if peekChar in ['']:
-                    self.error("expecting a valid delimiter after '*'", self.line, self.column)
-                    return True
-                else:
-                    self.error(f"invalid character after '*': {self.peek()}", self.line, self.column)
-                    return True
-            
-        elif char == '/':
-            self.advance()
-            if arith_dlm(self.peek()):
-                self.tokens.append(Token('/','/', start_line, start_col))
-                return True
-            elif self.peek() == '=':
-                self.advance()
-                if ass_dlm(self.peek()):
-                    self.tokens.append(Token('/=','/=', start_line, start_col))
-                    return True
-                else:
-                    peekChar = self.peek()
-                    if peekChar in ['']:
-                        self.error("expecting a valid delimiter after '/='", self.line, self.column)
-                        return True
-                    else:
-                        self.error(f"invalid character after '/=': {self.peek()}", self.line, self.column)
-                        return True
-            elif self.peek() == '/':
-                self.advance()
-                while self.peek() and self.peek() != '\n':
-                    self.advance()
-                return True
-            elif self.peek() == '~':
-                self.advance()
-                while self.peek() and not (self.peek() == '~' and self.peek(1) == '/'):
-                    self.advance()
-                if self.peek() == '~' and self.peek(1) == '/':
-                    self.advance()
-                    self.advance()
-                return True
-            else:
-                peekChar = self.peek()
-                if peekChar in ['']:
-                    self.error("expecting a valid delimiter after '/'", self.line, self.column)
-                    return True
-                else:
-                    self.error(f"invalid character after '/': {self.peek()}", self.line, self.column)
-                    return True
-            
-        elif char == '%':
-            self.advance()
-            if arith_dlm(self.peek()):
-                self.tokens.append(Token('%','%', self.line, self.column))
-                return True
-            elif self.peek() == '=':
-                self.advance()
-                if ass_dlm(self.peek()):
-                    self.tokens.append(Token('%=','%=', self.line, self.column))
-                    return True
-                else:
-                    peekChar = self.peek()
-                    if peekChar in ['']:
-                        self.error("expecting a valid delimiter after '%='", self.line, self.column)
-                        return True
-                    else:
-                        self.error(f"invalid character after '%=': {self.peek()}", start_line, start_col)
-                        return True
-            else:
-                peekChar = self.peek()
-                if peekChar in ['']:
-                    self.error("expecting a valid delimiter after '%'", self.line, self.column)
-                    return True
-                else:
-                    self.error(f"invalid character after '%': {self.peek()}", start_line, start_col)
-                    return True
-        
-        # structure - (),{},[]
-        elif char == '(':
-            self.advance()
-            if openpare_dlm(self.peek()):
-                self.tokens.append(Token('(','(', self.line, self.column))
-                return True
-            else:
-                peekChar = self.peek()
-                if peekChar in ['']:
-                    self.error("expecting a valid delimiter after '('", self.line, self.column)
-                    return True
-                else:
-                    self.error(f"invalid character after '(': {self.peek()}", start_line, start_col)
-                    return True
-            
-        elif char == ')':
-            self.advance()
-            if closepare_dlm(self.peek()):
-                self.tokens.append(Token(')',')', self.line, self.column))
-                return True
-            else:
-                peekChar = self.peek()
-                if peekChar in ['']:
-                    self.error("expecting a valid delimiter after ')'", self.line, self.column)
-                    return True
-                else:
-                    self.error(f"invalid character after ')': {self.peek()}", start_line, start_col)
-                    return True
-        
-        elif char == '{':
-            self.advance()
-            if opencurl_dlm(self.peek()):
-                self.tokens.append(Token('{','{', self.line, self.column))
-                return True
-            else:
-                peekChar = self.peek()
-                if peekChar in ['']:
-                    self.error("expecting a valid delimiter after '{'", self.line, self.column)
-                    return True
-                else:
-                    self.error(f"invalid character after '{{': {self.peek()}", start_line, start_col)
-                    return True
 
-        elif char == '}':
-            self.advance()
-            
-            if closecurl_dlm(self.peek()):
-                self.tokens.append(Token('}','}', self.line, self.column))
-                return True
-            else:
-                peekChar = self.peek()
-                if peekChar in ['']:
-                    self.error("expecting a valid delimiter after '}'", self.line, self.column)
-                    return True
-                else:
-                    self.error(f"invalid character after '}}': {self.peek()}", start_line, start_col)
-                    return True
-            
-        elif char == '[':
-            self.advance()
-            if opensqua_dlm(self.peek()):
-                self.tokens.append(Token('[','[', self.line, self.column))
-                return True
-            else:
-                peekChar = self.peek()
-                if peekChar in ['']:
-                    self.error("expecting a valid delimiter after '['", self.line, self.column)
-                    return True
-                else:
-                    self.error(f"invalid character after '[': {self.peek()}", start_line, start_col)
-                    return True
+        start_line, start_col = self.location(pos)
 
-        elif char == ']':
-            self.advance()
-            if closesqua_dlm(self.peek()):
-                self.tokens.append(Token(']',']', self.line, self.column))
-                return True
-            else:
-                peekChar = self.peek()
-                if peekChar in ['']:
-                    self.error("expecting a valid delimiter after ']'", self.line, self.column)
-                    return True
-                else:
-                    self.error(f"invalid character after ']': {self.peek()}", start_line, start_col)
-                    return True
-            
-        # operators - >, >=, <, <=, =, ==, !, !=
-        elif char == '>':
-            self.advance()
-            if rel_dlm(self.peek()):
-                self.tokens.append(Token('>','>', self.line, self.column))
-                return True
-            elif self.peek() == '=':
-                self.advance()
-                if rel_dlm(self.peek()):
-                    self.tokens.append(Token('>=','>=', self.line, self.column))
-                    return True
-                else:
-                    peekChar = self.peek()
-                    if peekChar in ['']:
-                        self.error("expecting a valid delimiter after '>='", self.line, self.column)
-                        return True
-                    else:
-                        self.error(f"invalid character after '>=': {self.peek()}", start_line, start_col)
-                        return True
-            else:
-                peekChar = self.peek()
-                if peekChar in ['']:
-                    self.error("expecting a valid delimiter after '>'", self.line, self.column)
-                    return True
-                else:
-                    self.error(f"invalid character after '>': {self.peek()}", start_line, start_col)
-                    return True
-            
-        elif char == '<':
-            self.advance()
-            if rel_dlm(self.peek()):
-                self.tokens.append(Token('<','<', self.line, self.column))
-                return True
-            elif self.peek() == '=':
-                self.advance()
-                if rel_dlm(self.peek()):
-                    self.tokens.append(Token('<=','<=', self.line, self.column))
-                    return True
-                else:
-                    peekChar = self.peek()
-                    if peekChar in ['']:
-                        self.error("expecting a valid delimiter after '<='", self.line, self.column)
-                        return True
-                    else:
-                        self.error(f"invalid character after '<=': {self.peek()}", start_line, start_col)
-                        return True
-            else:
-                peekChar = self.peek()
-                if peekChar in ['']:
-                    self.error("expecting a valid delimiter after '<'", self.line, self.column)
-                    return True
-                else:
-                    self.error(f"invalid character after '<': {self.peek()}", start_line, start_col)
-                    return True
-            
-        elif char == '=':
-            self.advance()
-            if equal_dlm(self.peek()):
-                self.tokens.append(Token('=','=', self.line, self.column))
-                return True
-            elif self.peek() == '=':
-                self.advance()
-                if eqto_dlm(self.peek()):
-                    self.tokens.append(Token('==','==', self.line, self.column))
-                    return True
-                else:
-                    peekChar = self.peek()
-                    if peekChar in ['']:
-                        self.error("expecting a valid delimiter after '=='", self.line, self.column)
-                        return True
-                    else:
-                        self.error(f"invalid character after '==': {self.peek()}", start_line, start_col)
-                        return True
-            else:
-                peekChar = self.peek()
-                if peekChar in ['']:
-                    self.error("expecting a valid delimiter after '='", self.line, self.column)
-                    return True
-                else:
-                    self.error(f"invalid character after '=': {self.peek()}", start_line, start_col)
-                    return True
-            
-        elif char == '!':
-            self.advance()
-            if not_dlm(self.peek()):
-                self.tokens.append(Token('!','!', self.line, self.column))
-                return True
-            elif self.peek() == '=':
-                self.advance()
-                if eqto_dlm(self.peek()):
-                    self.tokens.append(Token('!=','!=', self.line, self.column))
-                    return True
-                else:
-                    peekChar = self.peek()
-                    if peekChar in ['']:
-                        self.error("expecting a valid delimiter after '!='", self.line, self.column)
-                        return True
-                    else:
-                        self.error(f"invalid character after '!=': {self.peek()}", start_line, start_col)
-                        return True
-            else:
-                peekChar = self.peek()
-                if peekChar in ['']:
-                    self.error("expecting a valid delimiter after '!'", self.line, self.column)
-                    return True
-                else:
-                    self.error(f"invalid character after '!': {self.peek()}", start_line, start_col)
-                    return True
-            
-        elif char == '&':
-            self.advance()
-            if amper_dlm(self.peek()):
-                self.tokens.append(Token('&','&', self.line, self.column))
-                return True
-            elif self.peek() == '&':
-                self.advance()
-                if log_dlm(self.peek()):
-                    self.tokens.append(Token('&&','&&', self.line, self.column))
-                    return True
-                else:
-                    peekChar = self.peek()
-                    if peekChar in ['']:
-                        self.error("expecting a valid delimiter after '&&'", self.line, self.column)
-                        return True
-                    else:
-                        self.error(f"invalid character after '&&': {self.peek()}", start_line, start_col)
-                        return True
-            else:
-                peekChar = self.peek()
-                if peekChar in ['']:
-                    self.error("expecting a valid delimiter after '&'", self.line, self.column)
-                    return True
-                else:
-                    self.error(f"invalid character after '&': {self.peek()}", start_line, start_col)
-                    return True
-            
-        elif char == '|':
-            self.advance()
-            if self.peek() == '|':
-                self.advance()
-                if log_dlm(self.peek()):
-                    self.tokens.append(Token('||','||', self.line, self.column))
-                    return True
-                else:
-                    peekChar = self.peek()
-                    if peekChar in ['']:
-                        self.error("expecting a valid delimiter after '||'", self.line, self.column)
-                        return True
-                    else:
-                        self.error(f"invalid character after '||': {self.peek()}", start_line, start_col)
-                        return True
-            else:
-                self.error(f"'|' is not recognized. (Did you mean '||'?)", self.line, self.column)
+        # structure - (),{},[],:,.,~,,
+        delimiter_func = STRUCTURE_DELIMITERS.get(char)
+        if delimiter_func is not None:
+            self.position = pos = pos + 1
+            next_char = src[pos] if pos < self.length else ''
+            if delimiter_func(next_char):
+                self.emit(Token(char, char, start_line, start_col + 1))
+            elif next_char == '':
+                self.error(f"expecting a valid delimiter after '{char}'", self.line, self.column)
+            else:
+                self.error(f"invalid character after '{char}': {next_char}", start_line, start_col)
             return True
-        
-        # structure - :, ., ~, ,
-        elif char == ':':
-            self.advance()
-            if colon_dlm(self.peek()):
-                self.tokens.append(Token(':',':', self.line, self.column))
-                return True
-            else:
-                peekChar = self.peek()
-                if peekChar in ['']:
-                    self.error("expecting a valid delimiter after ':'", self.line, self.column)
-                    return True
-                else:
-                    self.error(f"invalid character after ':': {self.peek()}", start_line, start_col)
-                    return True
-            
-        elif char == '.':
-            self.advance()
-            if self.peek().isalpha():
-                self.tokens.append(Token('.','.', self.line, self.column))
-                return True
-            else:
-                peekChar = self.peek()
-                if peekChar in ['']:
-                    self.error("expecting a valid delimiter after '.'", self.line, self.column)
-                    return True
-                else:
-                    self.error(f"invalid character after '.': {self.peek()}", start_line, start_col)
-                    return True
-            
-        elif char == '~':
-            self.advance()
-            if term_dlm(self.peek()):
-                self.tokens.append(Token('~','~', self.line, self.column))
-                return True
-            else:
-                peekChar = self.peek()
-                if peekChar in ['']:
-                    self.error("expecting a valid delimiter after '~'", self.line, self.column)
-                    return True
-                else:
-                    self.error(f"invalid character after '~': {self.peek()}", start_line, start_col)
-                    return True
-            
-        elif char == ',':
+
+        # comments - //, /~ ~/
+        if char == '/' and self.peek(1) == '/':
+            # line comment runs up to (not including) the newline
+            end = self.source_code.find('\n', self.position)
+            self.position = self.length if end == -1 else end
+            return True
+        if char == '/' and self.peek(1) == '~':
+            # block comment runs through the closing '~/' or to EOF
+            end = self.source_code.find('~/', self.position + 2)
+            self.position = self.length if end == -1 else end + 2
+            return True
+
+        if char == '|' and self.peek(1) != '|':
             self.advance()
-            if comma_dlm(self.peek()):
-                self.tokens.append(Token(',',',', self.line, self.column))
+            self.error(f"'|' is not recognized. (Did you mean '||'?)", self.line, self.column)
+            return True
+
+        # operators - +, ++, +=, -, --, -=, *, *=, /, /=, %, %=, >, >=, <, <=,
+        # =, ==, !, !=, &, &&, ||
+        if char != '|' and char not in OPERATOR_DELIMITERS:
+            return None
+        # +, -, *, / and their compounds report the token (and a bad
+        # character after it) at the token start; the others one past it
+        from_start = char in START_POSITIONED
+        self.position = pos = pos + 1
+        next_char = src[pos] if pos < self.length else ''
+        if char != '|' and OPERATOR_DELIMITERS[char](next_char):
+            self.emit(Token(char, char, start_line, start_col if from_start else start_col + 1))
+            return True
+
+        compounds = COMPOUND_OPERATORS.get(char)
+        lexeme = compounds.get(next_char) if compounds is not None else None
+        if lexeme is None:
+            lexeme = char
+        else:
+            self.position = pos = pos + 1
+            next_char = src[pos] if pos < self.length else ''
+            if OPERATOR_DELIMITERS[lexeme](next_char):
+                self.emit(Token(lexeme, lexeme, start_line, start_col if from_start else start_col + 2))
                 return True
-            else:
-                peekChar = self.peek()
-                if peekChar in ['']:
-                    self.error("expecting a valid delimiter after ','", self.line, self.column)
-                    return True
-                else:
-                    self.error(f"invalid character after ',': {self.peek()}", start_line, start_col)
-                    return True
+
+        if next_char == '':
+            self.error(f"expecting a valid delimiter after '{lexeme}'", self.line, self.column)
+        elif from_start:
+            self.error(f"invalid character after '{lexeme}': {next_char}", self.line, self.column)
+        else:
+            self.error(f"invalid character after '{lexeme}': {next_char}", start_line, start_col)
+        return True
+
+    # '-' after an operand is subtraction; anywhere else it may start a
+    # negative number literal
+    def td_minus(self):
+        prev_char = self.peek_backwards(skip_whitespace=True)
+        if prev_char and (prev_char.isalnum() or prev_char in CLOSING):
+            return self.td_operator_structure()
+        return self.td_number() or self.td_operator_structure()
 
     # TRANSITION DIAGRAM: Character Literal
     def td_char(self):
         if self.peek() != '\'':
             return False
         
-        start_line = self.line
-        start_col = self.column
-        char_content = ''
+        start_line, start_col = self.location(self.position)
 
         self.advance()
-
-        while self.peek() and self.peek() not in '\'"\n':
-            if ord(self.peek()) < 128:
-                char_content += self.advance()
-            else:
-                self.advance()
+        char_content = self.scan_literal_content()
         if self.peek() == '\'':
             self.advance()
             if len(char_content) == 0 or len(char_content) == 1:
                 if singq_dlm(self.peek()):
-                    self.tokens.append(Token('char_lit', f"'{char_content}'", start_line, start_col))
+                    self.emit(Token('char_lit', f"'{char_content}'", start_line, start_col))
                     return True
                 else:
-                    peekChar = self.peek()
-                    if peekChar in ['', '\n']: 
-                        self.error(f"expecting a valid delimiter: '{char_content}'", self.line, self.column)
-                        return True
-                    else:
-                        self.error(f'invalid character after \'{char_content}\': {self.peek()}', self.line, self.column)
-                        return True
+                    return self.delimiter_error(self.peek(), f"'{char_content}'", self.line, self.column)
             else:
                 if singq_dlm(self.peek()):
                     self.error(f"expected none or exactly one character between single quotes: '{char_content}'", start_line, start_col)
                     return True
                 else:
                     self.error(f"expected none or exactly one character between single quotes: '{char_content}'", start_line, start_col)
-                    peekChar = self.peek()
-                    if peekChar in ['', '\n']:
-                        self.error(f"expecting a valid delimiter: '{char_content}'", self.line, self.column)
-                        return True
-                    else:
-                        self.error(f'invalid character after \'{char_content}\': {self.peek()}', self.line, self.column)
-                        return True
+                    return self.delimiter_error(self.peek(), f"'{char_content}'", self.line, self.column)
         else:
             if char_content == "":
                 self.error('unterminated single quote', start_line, start_col)
@@ -1154,32 +440,18 @@ class Lexer:
         if self.peek() != '"':
             return False
         
-        start_line = self.line
-        start_col = self.column
-        string_content = ""
+        start_line, start_col = self.location(self.position)
 
         self.advance()
-
-        while self.peek() and self.peek() not in '\'"\n':
-            self.peek()
-            if ord(self.peek()) < 128:
-                string_content += self.advance()
-            else:
-                self.advance()
+        string_content = self.scan_literal_content()
         if self.peek() == '"':
             self.advance()
             if doubq_dlm(self.peek()):
                 if string_content or not any(t.type == 'string_lit' for t in self.tokens[-5:]):
-                    self.tokens.append(Token('string_lit', f'"{string_content}"', start_line, start_col))
+                    self.emit(Token('string_lit', f'"{string_content}"', start_line, start_col))
                 return True
             else:
-                peekChar = self.peek()
-                if peekChar in ['', '\n']:
-                    self.error(f'expecting a valid delimiter: "{string_content}"', self.line, self.column)
-                    return True
-                else:
-                    self.error(f'invalid character after "{string_content}": {self.peek()}', self.line, self.column)
-                    return True
+                return self.delimiter_error(self.peek(), f'"{string_content}"', self.line, self.column)
         else:
             if string_content == "":
                 self.error('unterminated double quote', start_line, start_col)
@@ -1189,33 +461,37 @@ class Lexer:
                 return True
         
     # TRANSITION DIAGRAM: Identifiers
-    def td_identifier(self):
-        start_line = self.line
-        start_col = self.column
-        id_content = ""
-        
-        first_char = self.peek()
-        
-        if not first_char.isalpha():
+    # end is the word's end when td_keyword has already scanned it
+    def td_identifier(self, end=None):
+        src = self.source_code
+        pos = self.position
+        if pos >= self.length or not src[pos].isalpha():
             return False
-        while self.peek() and (self.peek().isalnum() or self.peek() == '_'):
-            id_content += self.advance()
+
+        start_line, start_col = self.location(pos)
+        if end is None:
+            end = WORD.match(src, pos).end()
+        id_content = src[pos:end]
+        self.position = end
         if len(id_content) > 15:
             self.error(f"'{id_content}' exceeds max length of 15 characters", start_line, start_col)
             return True
-        if not id_dlm(self.peek()):
-            peekChar = self.peek()
+        peekChar = src[end] if end < self.length else ''
+        if not id_dlm(peekChar):
             if peekChar in ['', '\n']:
                 self.error(f"expecting a valid delimiter: {id_content}", self.line, self.column)
                 return True
             else:
-                self.error(f"invalid character after '{id_content}': {self.peek()}", self.line, self.column)
+                self.error(f"invalid character after '{id_content}': {peekChar}", self.line, self.column)
                 return True
-        if id_content not in self.id_map:
+        # id_map keeps the first occurrence's text, so every token of the
+        # same identifier shares one value string
+        entry = self.id_map.get(id_content)
+        if entry is None:
             self.id_counter += 1
-            self.id_map[id_content] = f"id{self.id_counter}"
-        token_id = self.id_map[id_content]
-        self.tokens.append(Token(token_id, id_content, start_line, start_col))
+            entry = self.id_map[id_content] = (sys.intern(f"id{self.id_counter}"), id_content)
+        token_id, id_content = entry
+        self.emit(Token(token_id, id_content, start_line, start_col))
         return True
 
     # TRANSITION DIAGRAM: Invalid Identifier (starts with underscore)
@@ -1223,51 +499,53 @@ class Lexer:
         if self.peek() != '_':
             return False
         
-        start_line = self.line
-        start_col = self.column
-        illegal_sequence = self.advance()
-        
-        while self.peek() and (self.peek().isalnum() or self.peek() == '_'):
-            illegal_sequence += self.advance()
+        start_line, start_col = self.location(self.position)
+        end = WORD.match(self.source_code, self.position + 1).end()
+        illegal_sequence = self.source_code[self.position:end]
+        self.position = end
         
         self.error(f'invalid leading character (underscore): {illegal_sequence}', start_line, start_col)
         return True
     
     # TRANSITION DIAGRAM: Number Literal
     def td_number(self):
-        start_line = self.line
-        start_col = self.column
         saved_pos = self.position
-        saved_line = self.line
-        saved_col = self.column
         char = self.peek()
-        number = ''
         has_dot = False
         dot_count = 0
 
-        if char == '-':            
-            number += self.advance()
-            char = self.peek()
+        # look past a leading '-' without consuming it, so a non-number
+        # leaves the position untouched
+        if char == '-':
+            digits_start = saved_pos + 1
+            char = self.peek(1)
+        else:
+            digits_start = saved_pos
         
         if not char.isdigit():
-            if len(number) > 0:
-                self.position = saved_pos
-                self.line = saved_line
-                self.column = saved_col
             return False
-        
-        while self.peek() and self.peek().isdigit():
-            number += self.advance()
-        
-        if self.peek() == '.':
-            invalid_sequence = number
-            while self.peek() and (self.peek().isdigit() or self.peek() == '.'):
-                char = self.advance()
-                invalid_sequence += char
-                if char == '.':
-                    dot_count += 1
-                elif char.isdigit() and dot_count == 1:
-                    has_dot = True
+
+        start_line, start_col = self.location(saved_pos)
+        
+        src = self.source_code
+        length = self.length
+        end = DIGITS.match(src, digits_start).end()
+        while end < length and src[end].isdigit():
+            end += 1
+        # the lexeme (sign included) is always one slice from saved_pos
+        number = src[saved_pos:end]
+        self.position = end
+        
+        if src.startswith('.', end):
+            end = FRACTION.match(src, end).end()
+            while end < length and (src[end].isdigit() or src[end] == '.'):
+                end += 1
+            fraction = src[self.position:end]
+            self.position = end
+            invalid_sequence = src[saved_pos:end]
+            dot_count = fraction.count('.')
+            # a digit must follow the first dot before any second one
+            has_dot = fraction.split('.')[1] != ''
             
             if dot_count > 1:
                 self.error(f'invalid number literal with multiple decimal points: {invalid_sequence}', start_line, start_col)
@@ -1281,20 +559,18 @@ class Lexer:
             number = invalid_sequence
         
         # letters and number mixed
-        next_char = self.peek()
+        next_char = src[end] if end < length else ''
         if next_char and (next_char.isalpha() or next_char == '_'):
-            illegal_sequence = ""
-            while self.peek() and (self.peek().isalnum() or self.peek() == '_'):
-                illegal_sequence += self.advance()
-            illegal_lexeme = number + illegal_sequence
+            end = WORD.match(src, self.position).end()
+            self.position = end
+            illegal_lexeme = src[saved_pos:end]
             self.error(f'invalid number literal: {illegal_lexeme}', start_line, start_col)
             # self.error(f'invalid leading character (digit): {illegal_lexeme}', start_line, start_col)
             return True
         
-        parts = number.split('.')
-        integer_part = parts[0].lstrip('+-')
-        
         if has_dot:
+            parts = number.split('.')
+            integer_part = parts[0].lstrip('+-')
             if len(integer_part) > self.MAX_FLOAT:
                 self.error(f'{number} exceeds maximum digits before decimal of {self.MAX_FLOAT}', start_line, start_col)
                 return True
@@ -1302,74 +578,88 @@ class Lexer:
             if len(decimal_part) > self.MAX_FLOAT_POINT:
                 self.error(f'{number} exceeds maximum decimal places of {self.MAX_FLOAT_POINT}', start_line, start_col)
                 return True
-            if num_dlm(self.peek()):
-                self.tokens.append(Token('float_lit', number, start_line, start_col))
+            if num_dlm(next_char):
+                self.emit(Token('float_lit', number, start_line, start_col))
             else:
-                peekChar = self.peek()
-                if peekChar in ['', '\n']:
-                    self.error(f"expecting a valid delimiter: {number}", self.line, self.column)
-                    return True
-                else:
-                    self.error(f"invalid character after {number}: {self.peek()}", start_line, start_col)
-                    return True
+                return self.delimiter_error(next_char, number, start_line, start_col)
         else:
-            if len(integer_part) > len(str(self.MAX_INT)):
+            # the digit count alone bounds the value, so no int() is needed
+            if len(number.lstrip('+-')) > self.MAX_INT_DIGITS:
                 self.error(f'{number} exceeds maximum of 10 digits', start_line, start_col)
                 return True
-            if num_dlm(self.peek()):
-                self.tokens.append(Token('int_lit', number, start_line, start_col))
+            if num_dlm(next_char):
+                self.emit(Token('int_lit', number, start_line, start_col))
             else:
-                peekChar = self.peek()
-                if peekChar in ['', '\n']:
-                    self.error(f"expecting a valid delimiter: {number}", self.line, self.column)
-                    return True
-                else:
-                    self.error(f"invalid character after {number}: {self.peek()}", start_line, start_col)
-                    return True
+                return self.delimiter_error(next_char, number, start_line, start_col)
         return True
 
     # Main tokenization function
     def tokenize(self):
         self.tokens = []
-        while self.position < len(self.source_code):
-            # self.skip_whitespace()
-            
-            if self.position >= len(self.source_code):
+        self.emit = self.tokens.append
+        next_token = NEXT_TOKEN.match
+        src = self.source_code
+        while True:
+            # one match skips the whitespace run and lands on the next token
+            match = next_token(src, self.position)
+            if match is None:
+                self.position = self.length
                 break
-            
-            start_line = self.line
-            start_col = self.column
-            char = self.peek()
-
-            if char.isspace():
-                while self.peek() and self.peek().isspace():
-                    self.advance()
-                continue 
-            if char in '-':
-                prev_char = self.peek_backwards(skip_whitespace=True)
-                if prev_char and (prev_char.isalnum() or prev_char in ')]}'):
-                    if self.td_operator_structure():
-                        continue
-                else:
-                    if self.td_number():
-                        continue
-                    if self.td_operator_structure():
-                        continue   
-            if self.td_string():
-                continue
-            if self.td_char():
-                continue
-            if self.td_number():
-                continue
-            if self.td_keyword():
-                continue
-            if self.td_identifier():
+            word_end = match.end(1)
+            if word_end != -1:
+                # words are settled here: a keyword, else an identifier
+                self.position = pos = match.start(1)
+                if not (src[pos] in KEYWORD_INITIALS and self.td_keyword(word_end)):
+                    self.td_identifier(word_end)
                 continue
-            if self.td_operator_structure():
-                continue
-            if self.td_invalid_identifier():
-                continue
-            unknown = self.advance()
-            self.tokens.append(Token('ERROR', f'"{unknown}" is not recognized', start_line, start_col))
-        
-        return self.tokens
\ No newline at end of file
+            self.position = match.start(2)
+            char = match.group(2)
+
+            # Latin-1 comes from the table; wider characters are classified
+            # on the spot and never stored
+            scanners = SCANNERS.get(char)
+            if scanners is None:
+                scanners = wide_scanners(char)
+            for scan in scanners:
+                if scan(self):
+                    break
+            else:
+                start_line, start_col = self.location(self.position)
+                unknown = self.advance()
+                self.emit(Token('ERROR', f'"{unknown}" is not recognized', start_line, start_col))
+        
+        return self.tokens
+
+# FIRST-CHARACTER DISPATCH
+# The first character of a token already rules out most transition
+# diagrams, so each character is classified into the diagrams that can
+# start with it, kept in the order tokenize() tries them. Latin-1 is
+# classified once up front; wider characters are not cached, since past
+# Latin-1 only a digit or a letter can start a token.
+def scanners_for(char):
+    candidates = (
+        (char == '-', Lexer.td_minus),
+        (char == '"', Lexer.td_string),
+        (char == '\'', Lexer.td_char),
+        (char.isdigit(), Lexer.td_number),
+        (char in KEYWORD_INITIALS, Lexer.td_keyword),
+        (char.isalpha(), Lexer.td_identifier),
+        (char in OPERATOR_STRUCTURE, Lexer.td_operator_structure),
+        (char == '_', Lexer.td_invalid_identifier),
+    )
+    return tuple(scan for accepts, scan in candidates if accepts)
+
+SCANNERS = {chr(code): scanners_for(chr(code)) for code in range(256)}
+
+# the only dispatches past Latin-1, shared so classifying a wide character
+# allocates nothing
+WIDE_DIGIT = (Lexer.td_number,)
+WIDE_LETTER = (Lexer.td_identifier,)
+WIDE_OTHER = ()
+
+def wide_scanners(char):
+    if char.isdigit():
+        return WIDE_DIGIT
+    if char.isalpha():
+        return WIDE_LETTER
+    return WIDE_OTHER
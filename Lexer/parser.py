@@ -1,6 +1,8 @@
 from lexer import Token
 
 class ASTNode:
+    __slots__ = ('type', 'children', 'value')
+
     def __init__(self, type, children=None, value=None):
         self.type = type
         if children is None:
@@ -40,6 +42,8 @@ class ASTNode:
         return result
 
 class ParseError:
+    __slots__ = ('message', 'line', 'column')
+
     def __init__(self, message, line, column):
         self.message = message
         self.line = line
@@ -132,7 +136,7 @@ class Parser:
         try: 
             current = self.peek()
             
-            if current in ['universal', 'air', 'atmosphere']:
+            if current in {'universal', 'air', 'atmosphere'}:
                 ast = self.parse_program()
                 return ast, self.errors
             else:
@@ -192,7 +196,7 @@ class Parser:
             global_dec_node = self.parse_global_dec()
             return ASTNode('global_dec', children=[declaration_node, global_dec_node])
 
-        elif current in ['air', 'atmosphere']:
+        elif current in {'air', 'atmosphere'}:
             return ASTNode('global_dec_empty')
         
         else:
@@ -211,7 +215,7 @@ class Parser:
     def parse_declaration(self):
         current = self.peek()
         
-        if current in ['int', 'float', 'char', 'string', 'bool']:
+        if current in {'int', 'float', 'char', 'string', 'bool'}:
             normal_node = self.parse_normal()
             return ASTNode('declaration', children=[normal_node])
 
@@ -235,7 +239,7 @@ class Parser:
     def parse_normal(self):
         current = self.peek()
 
-        if current in ['int', 'float', 'char', 'string', 'bool']:
+        if current in {'int', 'float', 'char', 'string', 'bool'}:
             data_type_node = self.parse_data_type()
             id_no = self.check_id()
             norm_dec_node = self.parse_norm_dec()
@@ -245,7 +249,7 @@ class Parser:
             if current_tok != '~':
                 if current_tok == '}':
                     self.error(f"Missing '~' terminator.")
-                elif current_tok and current_tok not in [',', '~']:
+                elif current_tok and current_tok not in {',', '~'}:
                     self.error(f"Unexpected '{current_tok}' in declaration - expected ',' or '~'")
                 else:
                     self.error(f"Unexpected token: '{current}' | Expected '~' to end declaration")
@@ -277,14 +281,14 @@ class Parser:
             self.match('=')
 
             next_tok = self.peek()
-            if next_tok in [',', '~', None] or next_tok in ['atmosphere', 'air', 'universal']:
+            if next_tok in {',', '~', None} or next_tok in {'atmosphere', 'air', 'universal'}:
                 self.error(f"Expected value or expression after '=', not '{next_tok}'")
                 raise StopIteration
             
             expr_node = self.parse_expr()
 
             return ASTNode('norm_dec', children=[ASTNode('operator', value='='), expr_node])
-        elif current in [',', '~']:
+        elif current in {',', '~'}:
             
             return ASTNode('norm_dec_empty')
         else:
@@ -327,7 +331,7 @@ class Parser:
             arr_element_node = self.parse_arr_element()
             self.match('}')
             return ASTNode('array', children=[ASTNode('operator', value='='), arr_element_node])
-        elif current in [',','~']:
+        elif current in {',','~'}:
             return ASTNode('array_empty')
         else:
             self.error(f"Unexpected token: '{current}' | Expected '=' or ',' or terminator '~'")
@@ -342,8 +346,8 @@ class Parser:
     def parse_arr_element(self):
         current = self.peek()
 
-        if current in ['++', '--','toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
-                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '}'] or (current and current.startswith('id')): 
+        if current in {'++', '--','toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
+                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '}'} or (current and current.startswith('id')): 
             oned_element_node = self.parse_1d_element()
             return ASTNode('arr_element', children=[oned_element_node])
         elif current == '{':
@@ -363,8 +367,8 @@ class Parser:
     def parse_1d_element(self):
         current = self.peek()
 
-        if current in ['++', '--','toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
-                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit'] or (current and current.startswith('id')): 
+        if current in {'++', '--','toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
+                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit'} or (current and current.startswith('id')): 
             output_node = self.parse_output()
             element_tail_node = self.parse_element_tail()
             return ASTNode('1d_element', children=[output_node, element_tail_node])
@@ -508,7 +512,7 @@ class Parser:
     def parse_gust_tail(self):
         current = self.peek()
 
-        if current in ['int', 'float', 'char', 'string', 'bool']:
+        if current in {'int', 'float', 'char', 'string', 'bool'}:
             data_type_node = self.parse_data_type()
             id_no = self.check_id()
             self.match('~')
@@ -530,7 +534,7 @@ class Parser:
     def parse_constant(self):
         current = self.peek()
 
-        if current in ['int', 'float', 'char', 'string', 'bool']:
+        if current in {'int', 'float', 'char', 'string', 'bool'}:
             data_type_node = self.parse_data_type()
             id_no = self.check_id()
             const_dec_node = self.parse_const_dec()
@@ -601,8 +605,8 @@ class Parser:
     def parse_const_arr(self):
         current = self.peek()
 
-        if current in ['++', '--','toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
-                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit'] or (current and current.startswith('id')): 
+        if current in {'++', '--','toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
+                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit'} or (current and current.startswith('id')): 
             const_1d_node = self.parse_const_1d()
             return ASTNode('const_arr', children=[const_1d_node])
         elif current == '{':
@@ -619,8 +623,8 @@ class Parser:
     def parse_const_1d(self):
         current = self.peek()
 
-        if current in ['++', '--','toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
-                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit'] or (current and current.startswith('id')): 
+        if current in {'++', '--','toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
+                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit'} or (current and current.startswith('id')): 
             output_node = self.parse_output()
             element_tail_node = self.parse_element_tail()
             return ASTNode('const_1d', children=[output_node, element_tail_node])
@@ -702,9 +706,9 @@ class Parser:
         if current == '[':
             row_size_node = self.parse_row_size()
             return ASTNode('dimension', children=[row_size_node])
-        elif current in ['~', '++', '--', '=', '+=', '-=', '*=', '/=', '%=',
+        elif current in {'~', '++', '--', '=', '+=', '-=', '*=', '/=', '%=',
                         '+', '-', '*', '/', '%', ']', '>', '<', '>=', '<=', '==', '!=',
-                        ',', ')', '||', '&&', '}', '&' ]:
+                        ',', ')', '||', '&&', '}', '&' }:
             return ASTNode('dimension_empty')
         else:
             self.error(f"Unexpected token: '{current}' | Expected '~', '++', '--', '=', '+=', '-=', '*=', '/=', '%=', '+', '-', '*', '/', '%', ']', '>', '<', '>=', '<=', '==', '!=', ')', '}}', '&'")
@@ -766,9 +770,9 @@ class Parser:
             self.bracket_depth -= 1
             self.in_array_size = False 
             return ASTNode('col_size', children=[pdim_size_node])
-        elif current in ['~', '++', '--', '=', '+=', '-=', '*=', '/=', '%=',
+        elif current in {'~', '++', '--', '=', '+=', '-=', '*=', '/=', '%=',
                         '+', '-', '*', '/', '%', ']', '>', '<', '>=', '<=', '==', '!=',
-                        ',', ')', '||', '&&', '}', '&' ]:
+                        ',', ')', '||', '&&', '}', '&' }:
             return ASTNode('col_size_empty')
         else:
             self.error(f"Unexpected token: '{current}' | Expected '[', '}}', identifier, '~', '=', '+=', '-=', '*=', '/=', '%=', '+', '-', '*', '/', '%', ']', '>', '<', '>=', '<=', '==', '!=' , '&' statement, or 'gasp', ")
@@ -785,8 +789,8 @@ class Parser:
     def parse_size(self):
         current = self.peek()
 
-        if current in ['(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
-                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'] or (current and current.startswith('id')):
+        if current in {'(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
+                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'} or (current and current.startswith('id')):
             arith_expr_node = self.parse_arith_expr()
             return ASTNode('size', children=[arith_expr_node])
         elif current == ']':
@@ -872,7 +876,7 @@ class Parser:
     def parse_return_type(self):
         current = self.peek()
 
-        if current in ['int', 'float', 'char', 'string', 'bool']:
+        if current in {'int', 'float', 'char', 'string', 'bool'}:
             data_type_node = self.parse_data_type()
             return ASTNode('return_type', children=[data_type_node])
         elif current == 'vacuum':
@@ -892,7 +896,7 @@ class Parser:
     def parse_params(self):
         current = self.peek()
 
-        if current in ['int', 'float', 'char', 'string', 'bool']:
+        if current in {'int', 'float', 'char', 'string', 'bool'}:
             data_type_node = self.parse_data_type()
             id_no = self.check_id()
             params_dim_node = self.parse_params_dim()
@@ -918,7 +922,7 @@ class Parser:
             self.match('[')
             pdim_tail_node = self.parse_pdim_tail()
             return ASTNode('params_dim', children=[pdim_tail_node])
-        elif current in [',',')']:
+        elif current in {',',')'}:
             return ASTNode('params_dim_node')
         else:
             self.error(f"Unexpected token: '{current}' | Expected '[' or ',' or ')'")
@@ -938,8 +942,8 @@ class Parser:
         if current == ']':
             self.match(']')
             return ASTNode('params_pdim_tail', value=']')
-        elif current in ['(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
-                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'] or (current and current.startswith('id')):
+        elif current in {'(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
+                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'} or (current and current.startswith('id')):
             pdim_size_node = self.parse_pdim_size()
             self.match(']')
             self.match('[')
@@ -958,8 +962,8 @@ class Parser:
     def parse_pdim_size(self):
         current = self.peek()
 
-        if current in ['(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
-                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'] or (current and current.startswith('id')):
+        if current in {'(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
+                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'} or (current and current.startswith('id')):
             arith_expr_node = self.parse_arith_expr()
             return ASTNode('pdim_size', children=[arith_expr_node])
         else:
@@ -996,8 +1000,8 @@ class Parser:
     def parse_body(self):
         current = self.peek()
 
-        if current in ['int', 'float', 'char', 'string', 'bool', 'gust', 'wind', 'inhale', 'exhale', '++', '--',
-                            'if', 'stream', 'cycle', 'echo', 'do', '}', 'gasp'] or (current and current.startswith('id')):
+        if current in {'int', 'float', 'char', 'string', 'bool', 'gust', 'wind', 'inhale', 'exhale', '++', '--',
+                            'if', 'stream', 'cycle', 'echo', 'do', '}', 'gasp'} or (current and current.startswith('id')):
             stmt_list_node = self.parse_stmt_list()
             return ASTNode('body', children=[stmt_list_node])
         elif current == None:
@@ -1018,8 +1022,8 @@ class Parser:
     def parse_stmt_list(self):
         current = self.peek()
 
-        if current in ['int', 'float', 'char', 'string', 'bool', 'gust', 'wind', 'inhale', 'exhale', '++', '--',
-                            'if', 'stream', 'cycle', 'echo', 'do'] or (current and current.startswith('id')):
+        if current in {'int', 'float', 'char', 'string', 'bool', 'gust', 'wind', 'inhale', 'exhale', '++', '--',
+                            'if', 'stream', 'cycle', 'echo', 'do'} or (current and current.startswith('id')):
             statement_node = self.parse_statement()
 
             if statement_node is None: 
@@ -1027,7 +1031,7 @@ class Parser:
 
             stmt_list_node = self.parse_stmt_list()
             return ASTNode('stmt_list', children=[statement_node, stmt_list_node])
-        elif current in ['}','gasp','resist']:
+        elif current in {'}','gasp','resist'}:
             return ASTNode('stmt_list_empty')
         elif current == None:
             raise StopIteration
@@ -1049,19 +1053,19 @@ class Parser:
     def parse_statement(self):
         current = self.peek()
         try:
-            if current in ['int', 'float', 'char', 'string', 'bool', 'gust', 'wind']:
+            if current in {'int', 'float', 'char', 'string', 'bool', 'gust', 'wind'}:
                 declaration_node = self.parse_declaration()
                 return ASTNode('statement', children=[declaration_node])
-            elif current in ['inhale', 'exhale']:
+            elif current in {'inhale', 'exhale'}:
                 input_output_node = self.parse_input_output()
                 return ASTNode('statement', children=[input_output_node])
-            elif current in ['++', '--'] or (current and current.startswith('id')):
+            elif current in {'++', '--'} or (current and current.startswith('id')):
                 identifier_stat_node = self.parse_identifier_stat()
                 return ASTNode('statement', children=[identifier_stat_node])
-            elif current in ['if', 'stream']:
+            elif current in {'if', 'stream'}:
                 conditioner_node = self.parse_conditioner()
                 return ASTNode('statement', children=[conditioner_node])
-            elif current in ['cycle', 'echo', 'do']:
+            elif current in {'cycle', 'echo', 'do'}:
                 iteration_node = self.parse_iteration()
                 return ASTNode('statement', children=[iteration_node])
             else:
@@ -1082,7 +1086,7 @@ class Parser:
     def parse_identifier_stat(self):
         current = self.peek()
 
-        if current in ['++', '--']:
+        if current in {'++', '--'}:
             unary_op_node = self.parse_unary_op()
             id_no = self.check_id()
             id_access_node = None
@@ -1113,7 +1117,7 @@ class Parser:
             param_opts_node = self.parse_param_opts()
             self.match(')')
             return ASTNode('id_stat_body', children=[param_opts_node])
-        elif current in [ '[', '.', '++', '--', '=', '+=', '-=', '*=', '/=', '%=']:
+        elif current in { '[', '.', '++', '--', '=', '+=', '-=', '*=', '/=', '%='}:
             id_access_node = self.parse_id_access(81)
             id_stat_tail_node = self.parse_id_stat_tail()
             return ASTNode('id_stat_body', children=[id_access_node, id_stat_tail_node])
@@ -1130,10 +1134,10 @@ class Parser:
     def parse_id_stat_tail(self):
         current = self.peek()
 
-        if current in ['++', '--']:
+        if current in {'++', '--'}:
             unary_op_node = self.parse_unary_op()
             return ASTNode('id_stat_tail', children=[unary_op_node])
-        elif current in ['=', '+=', '-=', '*=', '/=', '%=']:
+        elif current in {'=', '+=', '-=', '*=', '/=', '%='}:
             assignment_node = self.parse_assignment()
             return ASTNode('id_stat_tail', children=[assignment_node])
         else:
@@ -1149,7 +1153,7 @@ class Parser:
     def parse_identifier(self):
         current = self.peek()
 
-        if current in ['++', '--']:
+        if current in {'++', '--'}:
             unary_op_node = self.parse_unary_op()
             id_no = self.check_id()
             id_access_node = self.parse_id_access(84)
@@ -1176,8 +1180,8 @@ class Parser:
             param_opts_node = self.parse_param_opts()
             self.match(')')
             return ASTNode('id_tail', children=[param_opts_node])
-        elif current in ['[', '.', '~', '++', '--', '=','+=', '-=', '*=', '/=', '%=',
-                         '+', '-', '*', '/', '%', ']', '>', '<', '>=', '<=', '==', '!=',',', ')', '||', '&&', '}', '&']:
+        elif current in {'[', '.', '~', '++', '--', '=','+=', '-=', '*=', '/=', '%=',
+                         '+', '-', '*', '/', '%', ']', '>', '<', '>=', '<=', '==', '!=',',', ')', '||', '&&', '}', '&'}:
             id_access_node = self.parse_id_access(87)
             unary_op2_node = self.parse_unary_op2()
             return ASTNode('id_tail', children=[id_access_node, unary_op2_node])
@@ -1205,8 +1209,8 @@ class Parser:
     def parse_id_access(self, prodNo):
         current = self.peek()
 
-        if prodNo in [94, 163]:
-            if current in ['[', '~', ')']:
+        if prodNo in {94, 163}:
+            if current in {'[', '~', ')'}:
                 dimension_node = self.parse_dimension()
                 return ASTNode('id_access', children=[dimension_node])
             elif current == '.':
@@ -1218,7 +1222,7 @@ class Parser:
                 raise StopIteration
             
         if prodNo == 175:
-            if current in ['[', '=']:
+            if current in {'[', '='}:
                 dimension_node = self.parse_dimension()
                 return ASTNode('id_access', children=[dimension_node])
             elif current == '.':
@@ -1231,7 +1235,7 @@ class Parser:
 
                 
         if prodNo == 182:
-            if current in ['[', '~']:
+            if current in {'[', '~'}:
                 dimension_node = self.parse_dimension()
                 return ASTNode('id_access', children=[dimension_node])
             elif current == '.':
@@ -1242,8 +1246,8 @@ class Parser:
                 self.error(f"Unexpected token: '{current}' | Expected [, ., or ~ after identifier, got '{current}'")
                 raise StopIteration
 
-        if current in ['[', '~', '++', '--', '=','+=', '-=', '*=', '/=', '%=',
-                         '+', '-', '*', '/', '%', ']', '>', '<', '>=', '<=', '==', '!=',',', ')', '||', '&&', '}', '&']:
+        if current in {'[', '~', '++', '--', '=','+=', '-=', '*=', '/=', '%=',
+                         '+', '-', '*', '/', '%', ']', '>', '<', '>=', '<=', '==', '!=',',', ')', '||', '&&', '}', '&'}:
             dimension_node = self.parse_dimension()
             return ASTNode('id_access', children=[dimension_node])
         elif current == '.':
@@ -1298,10 +1302,10 @@ class Parser:
     def parse_unary_op2(self):
         current = self.peek()
 
-        if current in ['++', '--']:
+        if current in {'++', '--'}:
             unary_op_node = self.parse_unary_op()
             return ASTNode('unary_op2', children=[unary_op_node])
-        elif current in ['+', '-', '*', '/', '%', ']', '>', '<', '>=', '<=', '==', '!=', ',', '~', ')', '||', '&&', '}', '&']:
+        elif current in {'+', '-', '*', '/', '%', ']', '>', '<', '>=', '<=', '==', '!=', ',', '~', ')', '||', '&&', '}', '&'}:
             return ASTNode('unary_op2_empty')
         else:
             self.error(f"Unexpected token: '{current}' | Expected ++, --, +, -, *, /, %, ], >, <, >=, <=, ==, !=, ,, ~, ), ||, &&, }}, &")
@@ -1343,8 +1347,8 @@ class Parser:
     def parse_output(self):
         current = self.peek()
 
-        if current in ['int_lit', 'float_lit', 'yuh', 'naur', 'char_lit', 'string_lit', '++', '--', 
-                       'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft'] or (current and current.startswith('id')):
+        if current in {'int_lit', 'float_lit', 'yuh', 'naur', 'char_lit', 'string_lit', '++', '--', 
+                       'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft'} or (current and current.startswith('id')):
             literal_node = self.parse_literal()
             return ASTNode('output', children=[literal_node])
         else:
@@ -1361,11 +1365,11 @@ class Parser:
     def parse_literal(self):
         current = self.peek()
         
-        if current in ['int_lit', 'float_lit', 'yuh', 'naur']:
+        if current in {'int_lit', 'float_lit', 'yuh', 'naur'}:
             value_node = self.parse_value()
             return ASTNode('literal', children=[value_node])
-        elif current in ['char_lit', 'string_lit', '++', '--', 
-                       'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft'] or (current and current.startswith('id')):
+        elif current in {'char_lit', 'string_lit', '++', '--', 
+                       'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft'} or (current and current.startswith('id')):
             output_concat_node = self.parse_output_concat()
             output_tail_node = self.parse_output_tail()
             return ASTNode('literal', children=[output_concat_node, output_tail_node])
@@ -1416,10 +1420,10 @@ class Parser:
         elif current == 'string_lit':
             litvalue = self.match('string_lit')
             return ASTNode('output_content', value=litvalue.value)
-        elif current in ['++', '--'] or (current and current.startswith('id')):
+        elif current in {'++', '--'} or (current and current.startswith('id')):
             identifier_node = self.parse_identifier()
             return ASTNode('output', children=[identifier_node])
-        elif current in ['toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft']:
+        elif current in {'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft'}:
             function_call_node = self.parse_function_call()
             return ASTNode('output', children=[function_call_node])
         else:
@@ -1440,7 +1444,7 @@ class Parser:
             output_concat_node = self.parse_output_concat()
             output_tail_node = self.parse_output_tail()
             return ASTNode('output_tail', children=[output_concat_node, output_tail_node])
-        elif current in ['+', '-', '*', '/', '%', ']', '>', '<', '>=', '<=', '==', '!=', ',', '~', ')', '||', '&&', '}']:
+        elif current in {'+', '-', '*', '/', '%', ']', '>', '<', '>=', '<=', '==', '!=', ',', '~', ')', '||', '&&', '}'}:
             return ASTNode('output_tail_empty')
         else:
             self.error(f"Unexpected token: '{current}' | Expected '+', '-', '*', '/', '%', ']', '>', '<', '>=', '<=', '==', '!=', '||', '&&', or terminator '~'")
@@ -1481,7 +1485,7 @@ class Parser:
     def parse_assignment(self):
         current = self.peek()
 
-        if current in ['=', '+=', '-=', '*=', '/=', '%=']:
+        if current in {'=', '+=', '-=', '*=', '/=', '%='}:
             assi_op_node = self.parse_assi_op()
             expr_node = self.parse_expr()
             return ASTNode('assignment', children=[assi_op_node, expr_node])
@@ -1496,8 +1500,8 @@ class Parser:
     def parse_expr(self):
         current = self.peek()
 
-        if current in ['(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
-                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'] or (current and current.startswith('id')):
+        if current in {'(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
+                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'} or (current and current.startswith('id')):
             logic_expr_node = self.parse_logic_expr()
             return ASTNode('expr', children=[logic_expr_node])
         else:
@@ -1511,8 +1515,8 @@ class Parser:
     def parse_logic_expr(self):
         current = self.peek()
 
-        if current in ['(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
-                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'] or (current and current.startswith('id')):
+        if current in {'(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
+                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'} or (current and current.startswith('id')):
             and_expr_node = self.parse_and_expr()
             or_tail_node = self.parse_or_tail()
             return ASTNode('logic_expr', children=[and_expr_node, or_tail_node])
@@ -1541,7 +1545,7 @@ class Parser:
             and_expr_node = self.parse_and_expr()
             or_tail_node = self.parse_or_tail()
             return ASTNode('or_tail', children=[and_expr_node, or_tail_node])
-        elif current in ['~', ',', ')']:
+        elif current in {'~', ',', ')'}:
             return ASTNode('or_tail_empty')
         else:
             expected = "'||'"
@@ -1560,8 +1564,8 @@ class Parser:
     def parse_and_expr(self):
         current = self.peek()
 
-        if current in ['(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
-                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'] or (current and current.startswith('id')):
+        if current in {'(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
+                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'} or (current and current.startswith('id')):
             rela_expr_node = self.parse_rela_expr()
             and_tail_node = self.parse_and_tail()
             return ASTNode('and_expr', children=[rela_expr_node, and_tail_node])
@@ -1590,7 +1594,7 @@ class Parser:
             rela_expr_node = self.parse_rela_expr()
             and_tail_node = self.parse_and_tail()
             return ASTNode('and_tail', children=[rela_expr_node, and_tail_node])
-        elif current in ['||', '~', ',', ')']:
+        elif current in {'||', '~', ',', ')'}:
             return ASTNode('and_tail_empty')
         else:
             expected = "'&&' or '||'"
@@ -1609,8 +1613,8 @@ class Parser:
     def parse_rela_expr(self):
         current = self.peek()
 
-        if current in ['(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
-                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'] or (current and current.startswith('id')):
+        if current in {'(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
+                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'} or (current and current.startswith('id')):
             arith_expr_node = self.parse_arith_expr()
             rela_tail_node = self.parse_rela_tail()
             return ASTNode('rela_expr', children=[arith_expr_node, rela_tail_node])
@@ -1628,7 +1632,7 @@ class Parser:
     def parse_rela_tail(self):
         current = self.peek()
 
-        if current in ['>', '<', '>=', '<=', '==', '!=']:
+        if current in {'>', '<', '>=', '<=', '==', '!='}:
             rela_sym_node = self.parse_rela_sym()
 
             next_tok = self.peek()
@@ -1640,7 +1644,7 @@ class Parser:
             arith_expr_node = self.parse_arith_expr()
             self.rela_used = False
             return ASTNode('rela_tail', children=[rela_sym_node, arith_expr_node])
-        elif current in ['&&', '||', '~', ',', ')']:
+        elif current in {'&&', '||', '~', ',', ')'}:
             return ASTNode('rela_tail_empty')
         else:
             self.error(f"Unexpected token: '{current}' | Expected relational symbols (> < >= <= == !=) or '&&' '||' '~' ',' ')'")
@@ -1716,8 +1720,8 @@ class Parser:
     def parse_arith_expr(self):
         current = self.peek()
 
-        if current in ['(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
-                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'] or (current and current.startswith('id')):
+        if current in {'(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
+                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'} or (current and current.startswith('id')):
             term_node = self.parse_term()
             arith_tail_node = self.parse_arith_tail()
             return ASTNode('arith_expr', children=[term_node, arith_tail_node])
@@ -1736,7 +1740,7 @@ class Parser:
         current = self.peek()
         expected = "+, -, *, /, %, ||, &&"
 
-        if current in ['+', '-']:
+        if current in {'+', '-'}:
             arith_op1_node = self.parse_arith_op1()
 
             next_tok = self.peek()
@@ -1747,9 +1751,9 @@ class Parser:
             term_node = self.parse_term()
             arith_tail_node = self.parse_arith_tail()
             return ASTNode('arith_tail', children=[arith_op1_node, term_node, arith_tail_node])
-        elif current in ['~', ',', ']', ')', '||', '&&']:
+        elif current in {'~', ',', ']', ')', '||', '&&'}:
             return ASTNode('arith_tail_empty')
-        elif current in ['>', '<', '>=', '<=', '==', '!=']:
+        elif current in {'>', '<', '>=', '<=', '==', '!='}:
             if self.rela_used:
                 if self.paren_depth > 0:
                     self.error(f"Unexpected token: '{current}' | Expected {expected}, or ) to close")
@@ -1786,8 +1790,8 @@ class Parser:
     def parse_term(self):
         current = self.peek()
 
-        if current in ['(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
-                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'] or (current and current.startswith('id')):
+        if current in {'(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
+                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'} or (current and current.startswith('id')):
             factor_node = self.parse_factor()
             term_tail_node = self.parse_term_tail()
             return ASTNode('term', children=[factor_node, term_tail_node])
@@ -1807,7 +1811,7 @@ class Parser:
     def parse_term_tail(self):
         current = self.peek()
 
-        if current in ['*', '/', '%']:
+        if current in {'*', '/', '%'}:
             arith_op2_node = self.parse_arith_op2()
 
             next_tok = self.peek()
@@ -1818,7 +1822,7 @@ class Parser:
             factor_node = self.parse_factor()
             term_tail_node = self.parse_term_tail()
             return ASTNode('term_tail', children=[arith_op2_node, factor_node, term_tail_node])
-        elif current in ['~', ']', ',', ')', '||', '&&', '>', '<', '>=', '<=', '==', '!=', '+', '-']:
+        elif current in {'~', ']', ',', ')', '||', '&&', '>', '<', '>=', '<=', '==', '!=', '+', '-'}:
             return ASTNode('term_tail_empty')
         else:
             expected = "+, -, *, /, %, ||, &&"
@@ -1844,8 +1848,8 @@ class Parser:
     def parse_factor(self):
         current = self.peek()
 
-        if current in ['(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
-                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'] or (current and current.startswith('id')):
+        if current in {'(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
+                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'} or (current and current.startswith('id')):
             primary_node = self.parse_primary()
             return ASTNode('factor', children=[primary_node])
         else:
@@ -1880,8 +1884,8 @@ class Parser:
             self.match('-')
             negate_node = self.parse_negate()
             return ASTNode('primary', children=[negate_node])
-        elif current in ['++', '--','toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
-                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit'] or (current and current.startswith('id')): 
+        elif current in {'++', '--','toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
+                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit'} or (current and current.startswith('id')): 
             output_node = self.parse_output()
             return ASTNode('primary', children=[output_node])
         elif current == '!':
@@ -1893,9 +1897,9 @@ class Parser:
             self.match(')')
             return ASTNode('primary', children=[logic_expr_node])
         else:
-            if current in ['+', '-', '*', '/', '%', '=', '+=', '-=', '*=', '/=', '%=', '>', '<', '>=', '<=', '==', '!=']:
+            if current in {'+', '-', '*', '/', '%', '=', '+=', '-=', '*=', '/=', '%=', '>', '<', '>=', '<=', '==', '!='}:
                 self.error(f"Unexpected operator '{current}' - expected value (int_lit, float_lit, char_lit) or identifier")
-            elif current in ['~', '}', ',', ')']:
+            elif current in {'~', '}', ',', ')'}:
                 self.error(f"Unexpected token: '{current}' | Incomplete expression ")
             else:
                 self.error(f"Unexpected token: '{current}' | Expected value (int_lit, float_lit, char_lit), identifier, or '(' in expression")
@@ -1939,11 +1943,11 @@ class Parser:
     def parse_stmt_ctrl(self):
         current = self.peek()
 
-        if current in ['int', 'float', 'char', 'string', 'bool', 'gust', 'wind', 'inhale', 'exhale', '++', '--', 'if', 'stream', 'cycle', 'echo', 'do'] or (current and current.startswith('id')):
+        if current in {'int', 'float', 'char', 'string', 'bool', 'gust', 'wind', 'inhale', 'exhale', '++', '--', 'if', 'stream', 'cycle', 'echo', 'do'} or (current and current.startswith('id')):
             statement_node = self.parse_statement()
             stmt_ctrl_node = self.parse_stmt_ctrl()
             return ASTNode('stmt_ctrl', children=[statement_node, stmt_ctrl_node])
-        elif current in ['resist', 'flow', 'gasp']:
+        elif current in {'resist', 'flow', 'gasp'}:
             ctrl_flow_node = self.parse_ctrl_flow()
             return ASTNode('stmt_ctrl', children=[ctrl_flow_node])
         elif current == '}':
@@ -2043,8 +2047,8 @@ class Parser:
             stmt_ctrl_node = self.parse_stmt_ctrl()
             self.match('}')
             return ASTNode('if_tail', children=[stmt_ctrl_node])
-        elif current in ['}', 'int', 'float', 'char', 'string', 'bool', 'gust', 'wind', 'inhale', 'exhale', '++', '--', 
-                         'resist', 'flow', 'if', 'stream', 'cycle', 'echo', 'do', 'gasp'] or (current and current.startswith('id')):
+        elif current in {'}', 'int', 'float', 'char', 'string', 'bool', 'gust', 'wind', 'inhale', 'exhale', '++', '--', 
+                         'resist', 'flow', 'if', 'stream', 'cycle', 'echo', 'do', 'gasp'} or (current and current.startswith('id')):
             return ASTNode('if_tail_empty')
         else:
             self.error(f"Unexpected token: '{current}' | Expected 'elseif' or 'else' or '}}' or statements ('int', 'float', 'char', 'string', 'bool', 'gust', 'wind', 'inhale', 'exhale', '++', '--'," 
@@ -2058,8 +2062,8 @@ class Parser:
     def parse_cond_stat(self):
         current = self.peek()
 
-        if current in ['(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
-                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'] or (current and current.startswith('id')):
+        if current in {'(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
+                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'} or (current and current.startswith('id')):
             expr_node = self.parse_expr()
             return ASTNode('cond_stat', children=[expr_node])
         else:
@@ -2107,7 +2111,7 @@ class Parser:
             self.match('~')
             switch_cases_node = self.parse_switch_cases()
             return ASTNode('switch_cases', children=[switch_opts_node, stmt_list_node, switch_cases_node])
-        elif current in [ '}', 'diffuse']:
+        elif current in { '}', 'diffuse'}:
             return ASTNode('switch_cases_empty')
         else:
             self.error(f"Unexpected token: '{current}' | Expected 'case' or 'diffuse' or '}}'")
@@ -2408,8 +2412,8 @@ class Parser:
     def parse_param_opts(self):
         current = self.peek()
 
-        if current in ['(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
-                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'] or (current and current.startswith('id')):
+        if current in {'(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
+                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'} or (current and current.startswith('id')):
             param_list_node = self.parse_param_list()
             return ASTNode('param_opts', children=[param_list_node])
         elif current == ')':
@@ -2424,8 +2428,8 @@ class Parser:
     def parse_param_list(self):
         current = self.peek()
 
-        if current in ['(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
-                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'] or (current and current.startswith('id')):
+        if current in {'(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
+                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'} or (current and current.startswith('id')):
             param_item_node = self.parse_param_item()
             param_tail_node = self.parse_param_tail()
             return ASTNode('param_list', children=[param_item_node, param_tail_node])
@@ -2440,8 +2444,8 @@ class Parser:
     def parse_param_item(self):
         current = self.peek()
 
-        if current in ['(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
-                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'] or (current and current.startswith('id')):
+        if current in {'(', '++', '--', 'toRise', 'toFall', 'horizon', 'sizeOf', 'toInt', 'toFloat', 'toString', 'toChar', 'toBool', 'waft',
+                        'int_lit', 'float_lit', 'yuh', 'naur','char_lit', 'string_lit', '!', '-'} or (current and current.startswith('id')):
             expr_node = self.parse_expr()
             return ASTNode('param_item', children=[expr_node])
         else:
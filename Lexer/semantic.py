@@ -2,6 +2,8 @@ import re
 
 
 class SemanticError:
+    __slots__ = ('message', 'line', 'column')
+
     def __init__(self, message, line=0, column=0):
         self.message = message
         self.line = line
@@ -95,17 +97,17 @@ class SemanticAnalyzer:
             if token.type.startswith('id'):
                 token_map[token.value] = (token.line, token.column)
                 token_map[token.type] = (token.line, token.column)
-            elif token.type in (
+            elif token.type in {
                 'gust', 'air', 'wind', 'stream', 'resist', 'flow', 'gasp',
                 'cycle', 'if', 'elseif', 'else', 'inhale', 'exhale',
                 'atmosphere', 'echo', 'do',
-            ):
+            }:
                 if token.type not in keyword_positions:
                     keyword_positions[token.type] = []
                 keyword_positions[token.type].append((token.line, token.column))
                 if token.type not in token_map:
                     token_map[token.type] = (token.line, token.column)
-            elif token.type in ('int_lit', 'float_lit', 'string_lit', 'char_lit'):
+            elif token.type in {'int_lit', 'float_lit', 'string_lit', 'char_lit'}:
                 if token.value not in literal_positions:
                     literal_positions[token.value] = []
                 literal_positions[token.value].append((token.line, token.column))
@@ -646,18 +648,18 @@ class SemanticAnalyzer:
             return False
         if node.type == 'operator':
             return False
-        if node.type in ('arith_expr', 'arith_tail', 'term', 'term_tail',
+        if node.type in {'arith_expr', 'arith_tail', 'term', 'term_tail',
                          'logic_expr', 'and_expr', 'or_tail', 'and_tail',
-                         'rela_expr', 'rela_tail'):
+                         'rela_expr', 'rela_tail'}:
             if node.children and len(node.children) == 1:
                 return self._is_literal_only(node.children[0])
             if node.children and len(node.children) > 1:
                 has_operator = any(
-                    c.type == 'operator' or c.type in (
+                    c.type == 'operator' or c.type in {
                         'arith_op1', 'arith_op2', 'rela_sym',
                         'or_tail', 'and_tail', 'rela_tail',
                         'arith_tail', 'term_tail',
-                    )
+                    }
                     for c in node.children
                     if c.children
                 )
@@ -665,7 +667,7 @@ class SemanticAnalyzer:
                     return False
                 return all(self._is_literal_only(c) for c in node.children)
             return False
-        if node.type in ('expr', 'primary', 'factor', 'term', 'output', 'output_concat'):
+        if node.type in {'expr', 'primary', 'factor', 'term', 'output', 'output_concat'}:
             if node.children and len(node.children) == 1:
                 return self._is_literal_only(node.children[0])
             if node.children and len(node.children) > 1:
@@ -796,7 +798,7 @@ class SemanticAnalyzer:
                     return
         for child in node.children:
             if hasattr(child, 'type'):
-                if child.type in ('value', 'output_content', 'expr', 'identifier', 'function_call'):
+                if child.type in {'value', 'output_content', 'expr', 'identifier', 'function_call'}:
                     values.append(child)
                 else:
                     self._collect_struct_init_values(child, values)
@@ -1131,7 +1133,7 @@ class SemanticAnalyzer:
                 self._check_function_call(identifier, child)
             elif child.type == 'assignment':
                 self._check_assignment(child, identifier, actual_name)
-            elif child.type in ('id_stat_tail', 'identifier_stat'):
+            elif child.type in {'id_stat_tail', 'identifier_stat'}:
                 self._visit_id_stat_tail(child, identifier)
             elif child.type == 'id_access':
                 self._visit_id_access_for_assignment(child, identifier)
@@ -1229,12 +1231,12 @@ class SemanticAnalyzer:
         
         if compound_op is None:
             for c in assignment_node.children:
-                if isinstance(c, str) and c in ('+=', '-=', '*=', '/=', '%=', '='):
+                if isinstance(c, str) and c in {'+=', '-=', '*=', '/=', '%=', '='}:
                     compound_op = c
                     break
         
         # For compound assignments (+=, -=, *=, /=, %=), variable must support arithmetic
-        if compound_op in ('+=', '-=', '*=', '/=', '%='):
+        if compound_op in {'+=', '-=', '*=', '/=', '%='}:
             if symbol['data_type'] not in self.ARITHMETIC_TYPES:
                 line, col = self.get_location(identifier)
                 self.error(
@@ -1330,7 +1332,7 @@ class SemanticAnalyzer:
                     for c in child.children:
                         if c.type == 'expr':
                             types.append(self._get_expression_type(c))
-                elif child.type in ('param_list', 'param_tail'):
+                elif child.type in {'param_list', 'param_tail'}:
                     process_params(child)
         
         process_params(param_opts_node)
@@ -1384,7 +1386,7 @@ class SemanticAnalyzer:
         for child in node.children:
             if child.type == 'cond_stat':
                 cond_type = self._get_expression_type(child)
-                if cond_type and cond_type not in ('bool', 'int', 'float', 'char'):
+                if cond_type and cond_type not in {'bool', 'int', 'float', 'char'}:
                     line, col = self.get_node_location(child)
                     self.error(
                         f"Condition in 'if' must evaluate to a boolean-compatible type, got '{cond_type}'",
@@ -1423,7 +1425,7 @@ class SemanticAnalyzer:
                 else:
                     switch_type = symbol['data_type']
                     # stream expression must be int or char
-                    if switch_type not in ('int', 'char'):
+                    if switch_type not in {'int', 'char'}:
                         line, col = self.get_location(switch_var)
                         actual_name = self.get_actual_name(switch_var)
                         self.error(
@@ -1623,7 +1625,7 @@ class SemanticAnalyzer:
                 line, col,
             )
             return
-        if node.type in ('or_tail', 'and_tail') and node.children:
+        if node.type in {'or_tail', 'and_tail'} and node.children:
             line, col = self.get_location('exhale')
             self.error(
                 "Logical expressions are not allowed as output in exhale",
@@ -1688,7 +1690,7 @@ class SemanticAnalyzer:
             op = getattr(op_token, 'value', None)
 
         # Only apply this rule to magnitude operators
-        if op not in ('>', '<', '>=', '<='):
+        if op not in {'>', '<', '>=', '<='}:
             return
 
         left_type = self._get_expression_type(left_node)
@@ -1779,7 +1781,7 @@ class SemanticAnalyzer:
             op = op_node.value if hasattr(op_node, 'value') else None
             
             # Modulus requires integers (bool allowed per v2 §14.3, treated as int)
-            if op == '%' and right_type and right_type not in ('int', 'bool'):
+            if op == '%' and right_type and right_type not in {'int', 'bool'}:
                 line, col = self._find_value_location(right)
                 self.error(f"Modulus operator '%%' requires integer operands, got '{right_type}'", line, col)
             
@@ -1795,23 +1797,23 @@ class SemanticAnalyzer:
             right_type = self._get_expression_type(right)
             op = op_node.value if hasattr(op_node, 'value') else None
             
-            if op == '%' and right_type and right_type not in ('int', 'bool'):
+            if op == '%' and right_type and right_type not in {'int', 'bool'}:
                 line, col = self._find_value_location(right)
                 self.error(f"Modulus operator '%%' requires integer operands, got '{right_type}'", line, col)
             
             return right_type
         
         # Relational / logical tails always produce bool
-        if node.type in ('rela_tail', 'and_tail', 'or_tail'):
+        if node.type in {'rela_tail', 'and_tail', 'or_tail'}:
             if node.children:
                 return 'bool'
         
         # Wrapper nodes — delegate to first child
-        if node.type in (
+        if node.type in {
             'expr', 'logic_expr', 'and_expr', 'rela_expr', 'arith_expr',
             'term', 'factor', 'primary', 'size', 'pdim_size', 'row_size',
             'literal', 'cond_stat', 'output',
-        ):
+        }:
             if node.children:
                 child_type = self._get_expression_type(node.children[0])
                 # For arith_expr/term: check if there's a tail that promotes to float
@@ -1856,7 +1858,7 @@ class SemanticAnalyzer:
         if tail_node is None or not hasattr(tail_node, 'children') or not tail_node.children:
             return left_type
         
-        if tail_node.type in ('arith_tail_empty', 'term_tail_empty'):
+        if tail_node.type in {'arith_tail_empty', 'term_tail_empty'}:
             return left_type
         
         op_node = tail_node.children[0] if tail_node.children else None
@@ -1925,11 +1927,11 @@ class SemanticAnalyzer:
         param_items = []
         self._collect_param_items(node, param_items)
         
-        if func_name in ('toRise', 'toFall'):
+        if func_name in {'toRise', 'toFall'}:
             # Accepts strings, chars, string vars, char vars
             if param_items:
                 ptype = self._get_expression_type(param_items[0])
-                if ptype and ptype not in ('string', 'char'):
+                if ptype and ptype not in {'string', 'char'}:
                     line, col = self._find_value_location(param_items[0])
                     self.error(
                         f"'{func_name}' expects a string or char argument, got '{ptype}'",
@@ -1940,7 +1942,7 @@ class SemanticAnalyzer:
             # Accepts int, float, string
             if param_items:
                 ptype = self._get_expression_type(param_items[0])
-                if ptype and ptype not in ('int', 'float', 'string'):
+                if ptype and ptype not in {'int', 'float', 'string'}:
                     line, col = self._find_value_location(param_items[0])
                     self.error(
                         f"'horizon' expects an int, float, or string argument, got '{ptype}'",
@@ -1971,7 +1973,7 @@ class SemanticAnalyzer:
         elif func_name == 'toChar':
             if param_items:
                 ptype = self._get_expression_type(param_items[0])
-                if ptype and ptype not in ('int', 'string'):
+                if ptype and ptype not in {'int', 'string'}:
                     line, col = self._find_value_location(param_items[0])
                     self.error(f"'toChar' expects an int or string argument, got '{ptype}'", line, col)
         
@@ -1981,7 +1983,7 @@ class SemanticAnalyzer:
         elif func_name == 'waft':
             if len(param_items) >= 1:
                 p1type = self._get_expression_type(param_items[0])
-                if p1type and p1type not in ('float', 'int'):
+                if p1type and p1type not in {'float', 'int'}:
                     line, col = self._find_value_location(param_items[0])
                     self.error(f"'waft' first argument must be float or int, got '{p1type}'", line, col)
             if len(param_items) >= 2:
@@ -2006,7 +2008,7 @@ class SemanticAnalyzer:
                     self._collect_param_items(child, items)
     
     def _get_value_type(self, value):
-        if value in ('yuh', 'naur'):
+        if value in {'yuh', 'naur'}:
             return 'bool'
         try:
             if '.' in str(value):
@@ -2231,15 +2233,15 @@ class SemanticAnalyzer:
         if array_type == element_type:
             return True
         if array_type == 'int':
-            return element_type in ('int', 'bool', 'char', 'float')
+            return element_type in {'int', 'bool', 'char', 'float'}
         if array_type == 'float':
-            return element_type in ('float', 'int')
+            return element_type in {'float', 'int'}
         if array_type == 'char':
-            return element_type in ('char', 'int')
+            return element_type in {'char', 'int'}
         if array_type == 'string':
-            return element_type in ('string', 'char')
+            return element_type in {'string', 'char'}
         if array_type == 'bool':
-            return element_type in ('bool', 'int')
+            return element_type in {'bool', 'int'}
         return False
     
     def _validate_array_index(self, row_size_node):
@@ -0,0 +1,26 @@
+import json
+import os
+import unittest
+
+from lexer import Lexer
+
+# Sources paired with the tokens the original character-by-character lexer
+# produced for them: whole programs, every keyword and operator glued to
+# the characters that may or may not delimit it, numbers at the edges of
+# their limits, and random runs of valid and invalid lexemes
+GOLDEN_TOKENS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'golden_tokens.json')
+
+def token_fields(token):
+    return [token.type, token.value, token.line, token.column, token.is_error]
+
+class GoldenTokensTest(unittest.TestCase):
+    def test_tokens_match_golden_corpus(self):
+        with open(GOLDEN_TOKENS, encoding='utf-8') as golden:
+            cases = json.load(golden)
+        for source_code, expected in cases:
+            with self.subTest(source_code=source_code):
+                tokens = Lexer(source_code).tokenize()
+                self.assertEqual([token_fields(token) for token in tokens], expected)
+
+if __name__ == '__main__':
+    unittest.main()